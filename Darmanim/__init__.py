@@ -1,9 +1,33 @@
-from Darmanim.animations import *
-from Darmanim.color import *
-from Darmanim.draw import *
-from Darmanim.values import *
-from Darmanim.graph import *
-from Darmanim.plot import *
-from Darmanim.graph.polygons import *
-from Darmanim.time import *
-from Darmanim.window import *
\ No newline at end of file
+import importlib
+
+exports = {
+    'time': ('Clock',),
+    'easing': ('Easing', 'bounce', 'bounce_in', 'bounce_in_out', 'bounce_out', 'cubic_bezier', 'easings', 'get_easing', 'get_index', 'has_table', 'power_in', 'power_in_out', 'power_out', 'sine_in', 'sine_in_out', 'sine_out', 'spring'),
+    'batch': ('Batch',),
+    'values': ('Action', 'ActionEvent', 'Batched', 'BatchedContinuosValue', 'BatchedLerpValue', 'ContinuosValue', 'Event', 'LerpEvent', 'LerpEventGroup', 'LerpValue', 'MutableValue', 'Object', 'Reactive', 'Scheduler', 'SequenceValue', 'Value', 'constants', 'get_constant', 'get_dependencies', 'get_mutable', 'get_value', 'get_values', 'is_number', 'max_constants'),
+    'color': ('BatchedLerpColor', 'Color', 'LerpColor', 'Style', 'SwitchColor', 'get_color', 'get_colors', 'lerp'),
+    'animations': ('continous_phase', 'phase'),
+    'geometry': ('polygon_vertices', 'regular_polygon'),
+    'spatial': ('SpatialIndex',),
+    'render': ('Render',),
+    'profiler': ('Profiler',),
+    'window': ('Surface', 'VideoMP4', 'Window', 'get_pixel_format', 'is_animated', 'union_rects'),
+    'draw': ('AnimatedArc', 'AnimatedLine', 'AnimatedLines', 'AnimatedText', 'Arc', 'FastText', 'Group', 'Letter', 'Text', 'fonts'),
+    'graph.graph': ('Arrow', 'Axis', 'AxisLabels', 'Background', 'BlankGraph', 'BlankGrid', 'Function', 'Graph', 'Grid', 'Line', 'Lines', 'Path', 'Point', 'RingBuffer', 'get_rgb', 'get_shift', 'pixel', 'rect', 'unit'),
+    'graph.polygons': ('Circle', 'Ellipse', 'Polygon', 'Rectangle', 'RegularPolygon', 'Square', 'degrees'),
+    'plot': ('Plot', 'PlotGroup', 'PlotPoint', 'ScatterGroup', 'coordinate', 'footprints', 'get_footprint', 'get_marker', 'is_static', 'markers', 'max_markers', 'stamp', 'stamp_threshold')
+}
+modules = {name: module for module, names in exports.items() for name in names}
+
+
+def __getattr__(name: str) -> any:
+    if name == '__all__': return sorted(modules)
+    if name not in modules: raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    value = getattr(importlib.import_module(f'{__name__}.{modules[name]}'), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(globals().keys() | modules.keys())
@@ -13,6 +13,7 @@ def draw(animation_time: float, start_time: float=0, default: any=0):
                 return y
             except TypeError:
                 return y
+        wrapper.animated = True
         return wrapper
     return inner_draw
 
@@ -22,6 +23,7 @@ def phase(start: float, end: float, animation_time: float, start_time: float=0):
         value = LerpValue(start, end, animation_time, start_time)
         def wrapper(x: np.array, *args, **kwargs):
             return func(x + value.get(), *args, **kwargs)
+        wrapper.animated = True
         return wrapper
     return inner_phase
 
@@ -31,5 +33,6 @@ def continous_phase(start: float, step: float, animation_time: float, start_time
         value = ContinuosValue(start, step, animation_time, start_time)
         def wrapper(x: np.array, *args, **kwargs):
             return func(x + value.get(), *args, **kwargs)
+        wrapper.animated = True
         return wrapper
     return inner_phase
\ No newline at end of file
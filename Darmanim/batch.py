@@ -0,0 +1,93 @@
+from __future__ import annotations
+import weakref
+from Darmanim import lazy
+from Darmanim.time import Clock
+from Darmanim.easing import Easing
+
+np = lazy.load('numpy')
+dtypes = {
+    'start': float, 'end': float, 'start_time': float, 'begin': float, 'duration': float,
+    'value': float, 't': float, 'easing': int, 'continuous': bool, 'done': bool
+}
+
+
+class Batch:
+    enabled: bool = False
+    generation: int = 0
+    size: int = 0
+    capacity: int = 0
+    free: list[int] = []
+    start = end = start_time = begin = duration = value = t = easing = continuous = done = None
+
+    def enable(enabled: bool=True) -> None:
+        Batch.enabled = enabled
+
+    def grow() -> None:
+        capacity = max(256, 2 * Batch.capacity)
+        for name, dtype in dtypes.items():
+            grown = np.zeros(capacity, dtype=dtype)
+            if Batch.capacity: grown[:Batch.capacity] = getattr(Batch, name)
+            setattr(Batch, name, grown)
+        Batch.capacity = capacity
+
+    def allocate(owner: any, starts: list[float], ends: list[float], start_time: float, duration: float, continuous: bool=False, easing: int=0) -> np.ndarray:
+        lanes = []
+        for start, end in zip(starts, ends):
+            if Batch.free: lane = Batch.free.pop()
+            else:
+                if Batch.size == Batch.capacity: Batch.grow()
+                lane = Batch.size
+                Batch.size += 1
+
+            Batch.start[lane] = Batch.value[lane] = start
+            Batch.end[lane] = end
+            Batch.start_time[lane] = start_time
+            Batch.begin[lane] = max(start_time, Clock.birth_time())
+            Batch.duration[lane] = duration
+            Batch.t[lane] = 0
+            Batch.easing[lane] = easing
+            Batch.continuous[lane] = continuous
+            Batch.done[lane] = False
+            lanes.append(lane)
+
+        lanes = np.array(lanes)
+        weakref.finalize(owner, Batch.release, lanes, Batch.generation)
+        return lanes
+
+    def release(lanes: np.ndarray, generation: int) -> None:
+        if generation != Batch.generation: return
+        Batch.done[lanes] = True
+        Batch.free.extend(lanes.tolist())
+
+    def update() -> None:
+        if Batch.size == 0: return
+        n = Batch.size
+        lanes = np.flatnonzero(~Batch.done[:n] & (Batch.start_time[:n] <= Clock.time))
+        if len(lanes) == 0: return
+
+        duration = Batch.duration[lanes]
+        t = np.divide(Clock.time - Batch.begin[lanes], duration, out=np.ones(len(lanes)), where=duration != 0)
+        continuous = Batch.continuous[lanes]
+        t = np.where(continuous, t, np.minimum(t, 1))
+
+        eased = t
+        easing = Batch.easing[lanes]
+        if easing.any(): eased = np.where(easing > 0, Easing.lookup(easing, t), t)
+
+        start = Batch.start[lanes]
+        Batch.value[lanes] = start + (Batch.end[lanes] - start) * eased
+        Batch.t[lanes] = t
+        Batch.done[lanes] = ~continuous & (t == 1)
+
+    def is_running(lanes: np.ndarray) -> bool:
+        return not Batch.done[lanes].all()
+
+    def stats() -> dict[str, int]:
+        running = int((~Batch.done[:Batch.size]).sum()) if Batch.size else 0
+        return {'lanes': Batch.size - len(Batch.free), 'running': running}
+
+    def clear() -> None:
+        Batch.generation += 1
+        Batch.size = 0
+        Batch.free.clear()
+        if Batch.capacity: Batch.done[:] = True
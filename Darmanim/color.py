@@ -1,7 +1,12 @@
 from __future__ import annotations
 import math
+from Darmanim import lazy
 from Darmanim.time import time
-from Darmanim.values import Object, Value
+from Darmanim.batch import Batch
+from Darmanim.easing import easing, get_easing, get_index, has_table
+from Darmanim.values import Object, Value, Batched
+
+np = lazy.load('numpy')
 
 
 def get_color(value: any) -> Color:
@@ -109,7 +114,12 @@ class SwitchColor(Object):
 
 
 class LerpColor(Object):
-    def __init__(self, start: any, end: any, transition_time: time, start_time: time=0):
+    def __new__(cls, start: any, end: any, transition_time: time, start_time: time=0, easing: easing=None):
+        if cls is LerpColor and Batch.enabled and has_table(easing) and type(get_color(start)) is Color and type(get_color(end)) is Color:
+            return object.__new__(BatchedLerpColor)
+        return object.__new__(cls)
+
+    def __init__(self, start: any, end: any, transition_time: time, start_time: time=0, easing: easing=None):
         super().__init__(start_time)
         self.t = 0
         self.color = self.start = get_color(start)
@@ -117,10 +127,12 @@ class LerpColor(Object):
 
         self.start_time = start_time
         self.transition_time = transition_time
+        self.easing = get_easing(easing)
     
     def update(self) -> bool:
         self.t = min(self.time/self.transition_time, 1)
-        self.color = self.start + (self.end - self.start) * self.t
+        t = min(max(self.easing(self.t), 0), 1) if self.easing else self.t
+        self.color = self.start + (self.end - self.start) * t
 
         self.r, self.g, self.b = self.color.rgb()
 
@@ -130,6 +142,37 @@ class LerpColor(Object):
         return self.color.rgb()
 
 
+class BatchedLerpColor(Batched, LerpColor):
+    def __init__(self, start: any, end: any, transition_time: time, start_time: time=0, easing: easing=None):
+        self.start_time = start_time
+        self.transition_time = transition_time
+        self.easing = get_easing(easing)
+        start, end = get_color(start), get_color(end)
+        self.lanes = Batch.allocate(self, (start.r, start.g, start.b), (end.r, end.g, end.b), start_time, transition_time, easing=get_index(self.easing))
+
+    def get_channels(self, name: str) -> Color:
+        return Color(tuple(getattr(Batch, name)[self.lanes].tolist()))
+
+    def set_channels(self, name: str, color: any) -> None:
+        color = get_color(color)
+        getattr(Batch, name)[self.lanes] = (color.r, color.g, color.b)
+
+    color = property(lambda self: self.get_channels('value'))
+    start = property(lambda self: self.get_channels('start'), lambda self, color: self.set_channels('start', color))
+    end = property(lambda self: self.get_channels('end'), lambda self, color: self.set_channels('end', color))
+
+    def update(self) -> bool:
+        return not Batch.is_running(self.lanes)
+
+    def rgb(self) -> tuple[int, int, int]:
+        channels = Batch.value[self.lanes]
+        if self.easing:
+            start, end = Batch.start[self.lanes], Batch.end[self.lanes]
+            channels = channels.clip(np.minimum(start, end), np.maximum(start, end))
+        r, g, b = channels.tolist()
+        return (int(r), int(g), int(b))
+
+
 Color.white     = Color('#ffffff')
 Color.lightgray = Color('#bfbfbf')
 Color.gray      = Color('#7f7f7f')
@@ -3,9 +3,13 @@ import math
 import pygame
 import numpy as np
 from Darmanim.time import Clock
-from Darmanim.window import Surface
+from Darmanim.window import Surface, union_rects
+from Darmanim import render, spatial
+from Darmanim.draw import fonts
+from Darmanim.render import Render
+from Darmanim.geometry import regular_polygon
 from Darmanim.color import get_color, LerpColor
-from Darmanim.values import get_value, get_values, Value, LerpValue, LerpEventGroup, Action, LerpEvent, ActionEvent
+from Darmanim.values import get_value, get_values, get_mutable, Value, LerpValue, Reactive, LerpEventGroup, Action, LerpEvent, ActionEvent
 
 type pixel = float
 type degrees = float
@@ -13,9 +17,10 @@ type rect = tuple[pixel, pixel, pixel, pixel]
 type coordinate = tuple[pixel, pixel]
 
 
-class Line:
+class Line(Reactive):
     continous = 'continous'
     dashed = 'dashed'
+    dependencies = ('x0', 'y0', 'x1', 'y1', 'stroke')
 
     def __init__(
         self, surface: Surface,
@@ -26,7 +31,7 @@ class Line:
     ):
         self.surface = surface
         self.x0, self.y0 = get_values(start)
-        self.x1, self.y1 = get_values(end)
+        self.x1, self.y1 = map(get_mutable, end)
 
         self.start = (self.x0, self.y0)
         self.end = (self.x1, self.y1)
@@ -47,6 +52,7 @@ class Line:
         dy = self.length * math.sin(self.angle.get())
         self.x1.value = self.x0.get() + dx
         self.y1.value = self.y0.get() + dy
+        self.touch()
 
         self.mid = (self.x0.get() + self.x1.get()) / 2, (self.y0.get() + self.y1.get()) / 2
 
@@ -67,28 +73,37 @@ class Line:
             Action(self.set_length, start_time, args=(length, 0, transition_time))
         return self
 
-    def show_continous(self, start: coordinate, end: coordinate) -> None:
-        pygame.draw.line(self.surface.screen, self.color.rgb(), start, end, self.stroke.get(int))
+    def show_continous(self, start: coordinate, end: coordinate) -> pygame.Rect:
+        return render.line(self.surface.screen, self.color.rgb(), start, end, self.stroke.get(int))
     
-    def show_dashed(self, start: coordinate, end: coordinate) -> None:
+    def show_dashed(self, start: coordinate, end: coordinate) -> pygame.Rect|None:
         x1, y1 = start
         x2, y2 = end
         dl = 50
 
         dashes = int(self.length.get() / dl)
+        if dashes <= 0: return None
 
-        for i in range(dashes):
-            start = (x1 + (x2 - x1) * i / dashes, y1 + (y2 - y1) * i / dashes)
-            end = (x1 + (x2 - x1) * (i + 0.5) / dashes, y1 + (y2 - y1) * (i + 0.5) / dashes)
-            pygame.draw.line(self.surface.screen, self.color.rgb(), start, end)
+        i = np.arange(2 * dashes) / 2
+        segments = np.column_stack((x1 + (x2 - x1) * i / dashes, y1 + (y2 - y1) * i / dashes))
+        return render.segments(self.surface.screen, self.color.rgb(), segments)
 
-    def show(self) -> None:
+    def update(self, update_values: bool=False) -> None:
+        self.changed()
+
+    def get_rect(self) -> rect:
+        x0, y0, x1, y1 = self.x0.get(), self.y0.get(), self.x1.get(), self.y1.get()
+        return spatial.inflate((min(x0, x1), min(y0, y1), abs(x1 - x0), abs(y1 - y0)), self.stroke.get() + 2)
+
+    def show(self) -> pygame.Rect|None:
         if Clock.time < self.start_time: return
         start, end = (self.x0.get(), self.y0.get()), (self.x1.get(), self.y1.get())
-        getattr(self, f'show_{self.line_type}')(start, end)        
+        return getattr(self, f'show_{self.line_type}')(start, end)        
 
 
-class Lines:
+class Lines(Reactive):
+    dependencies = ('points', 'stroke')
+
     def __init__(
         self, surface: Surface,
         points: list[coordinate], color: any='white',
@@ -102,23 +117,25 @@ class Lines:
         self.stroke = get_value(stroke)
         self.start_time = start_time
 
-        f = lambda p: type(p[0]) != Value or type(p[1]) != Value
-        self.should_update = any(map(f, self.points)) 
-
         self.update(update_values=True)
         surface.add_element(self, z_index)
     
     def update(self, update_values: bool=False) -> None:
-        if not update_values:
-            if Clock.time < self.start_time or not self.should_update: return
+        if not update_values and Clock.time < self.start_time: return
+        if not self.changed(): return
         self.coordinates = [(x.get(), y.get()) for x, y in self.points]
     
-    def show(self) -> None:
+    def get_rect(self) -> rect|None:
+        return spatial.get_rect(self.coordinates, self.stroke.get() + 2)
+
+    def show(self) -> pygame.Rect|None:
         if Clock.time < self.start_time: return
-        pygame.draw.lines(self.surface.screen, self.color.rgb(), self.closed, self.coordinates, self.stroke.get(int))
+        return render.lines(self.surface.screen, self.color.rgb(), self.closed, self.coordinates, self.stroke.get(int))
+
 
+class Circle(Reactive):
+    dependencies = ('x', 'y', 'radius', 'stroke')
 
-class Circle:
     def __init__(
         self, surface: Surface,
         center: tuple[pixel, pixel], radius: pixel,
@@ -131,7 +148,6 @@ class Circle:
         self.color = get_color(color)
         self.stroke = get_value(stroke)
 
-        self.should_update = type(self.x) != Value or type(self.y) != Value
         self.start_time = start_time
 
         self.update(update_values=True)
@@ -146,16 +162,22 @@ class Circle:
         return self
 
     def update(self, update_values: bool=False) -> None:
-        if not update_values:
-            if Clock.time < self.start_time or not self.should_update: return
+        if not update_values and Clock.time < self.start_time: return
+        if not self.changed(): return
         self.center = (self.x.get(), self.y.get())
     
-    def show(self) -> None:
+    def get_rect(self) -> rect:
+        radius = get_value(self.radius).get() + self.stroke.get() + 2
+        return (self.center[0] - radius, self.center[1] - radius, 2*radius, 2*radius)
+
+    def show(self) -> pygame.Rect|None:
         if Clock.time < self.start_time: return
-        pygame.draw.circle(self.surface.screen, self.color.rgb(), self.center, self.radius, self.stroke.get(int))
+        return render.circle(self.surface.screen, self.color.rgb(), self.center, self.radius, self.stroke.get(int))
+
 
+class Ellipse(Reactive):
+    dependencies = ('x', 'y', 'rx', 'ry', 'stroke')
 
-class Ellipse:
     def __init__(
         self, surface: Surface,
         center: tuple[pixel, pixel], rx: pixel, ry: pixel,
@@ -168,24 +190,28 @@ class Ellipse:
         self.color = get_color(color)
         self.stroke = get_value(stroke)
 
-        self.should_update = type(self.x) != Value or type(self.y) != Value or type(self.rx) != Value or type(self.ry) != Value
         self.start_time = start_time
 
         self.update(update_values=True)
         surface.add_element(self, z_index)
     
     def update(self, update_values: bool=False) -> None:
-        if not update_values:
-            if Clock.time < self.start_time or not self.should_update: return
+        if not update_values and Clock.time < self.start_time: return
+        if not self.changed(): return
         rx, ry = self.rx.get(), self.ry.get()
         self.rect = (self.x.get()-rx, self.y.get()-ry, 2*rx, 2*ry)
     
-    def show(self) -> None:
+    def get_rect(self) -> rect:
+        return spatial.inflate(self.rect, self.stroke.get() + 2)
+
+    def show(self) -> pygame.Rect|None:
         if Clock.time < self.start_time: return
-        pygame.draw.ellipse(self.surface.screen, self.color.rgb(), self.rect, self.stroke.get(int))
+        return render.ellipse(self.surface.screen, self.color.rgb(), self.rect, self.stroke.get(int))
+
 
+class Rectangle(Reactive):
+    dependencies = ('x', 'y', 'w', 'h', 'stroke')
 
-class Rectangle:
     def __init__(
         self, surface: Surface,
         rectangle: rect, color: any='white', stroke: pixel=1,
@@ -196,20 +222,22 @@ class Rectangle:
         self.color = color
         self.stroke = stroke
 
-        self.should_update = type(self.x) != Value or type(self.y) != Value or type(self.w) != Value or type(self.h) != Value
         self.start_time = start_time
 
         self.update(update_values=True)
         surface.add_element(self, z_index)
     
     def update(self, update_values: bool=False) -> None:
-        if not update_values:
-            if Clock.time < self.start_time or not self.should_update: return
+        if not update_values and Clock.time < self.start_time: return
+        if not self.changed(): return
         self.rect = (self.x.get(), self.y.get(), self.w.get(), self.h.get())
     
-    def show(self) -> None:
+    def get_rect(self) -> rect:
+        return spatial.inflate(self.rect, self.stroke.get() + 2)
+
+    def show(self) -> pygame.Rect|None:
         if Clock.time < self.start_time: return
-        pygame.draw.rect(self.surface.screen, self.color.rgb(), self.rect, self.stroke.get(int))
+        return render.rect(self.surface.screen, self.color.rgb(), self.rect, self.stroke.get(int))
 
     def __setattr__(self, name: str, value: any):
         if name in ('x', 'y', 'w', 'h', 'stroke'): return super().__setattr__(name, get_value(value))
@@ -217,7 +245,9 @@ class Rectangle:
         return super().__setattr__(name, value)
 
 
-class Polygon:
+class Polygon(Reactive):
+    dependencies = ('points', 'stroke')
+
     def __init__(
         self, surface: Surface,
         points: list[coordinate], color: any='white', stroke: pixel=1,
@@ -228,25 +258,27 @@ class Polygon:
 
         self.color = get_color(color)
         self.stroke = get_value(stroke)
-
-        f = lambda p: type(p[0]) != Value or type(p[1]) != Value
-        self.should_update = any(map(f, self.points))
         self.start_time = start_time
 
         self.update(update_values=True)
         surface.add_element(self, z_index)
     
     def update(self, update_values: bool=False) -> None:
-        if not update_values:
-            if Clock.time < self.start_time or not self.should_update: return
+        if not update_values and Clock.time < self.start_time: return
+        if not self.changed(): return
         self.coordinates = [(x.get(), y.get()) for x, y in self.points]
     
-    def show(self) -> None:
+    def get_rect(self) -> rect|None:
+        return spatial.get_rect(self.coordinates, self.stroke.get() + 2)
+
+    def show(self) -> pygame.Rect|None:
         if Clock.time < self.start_time: return
-        pygame.draw.polygon(self.surface.screen, self.color.rgb(), self.coordinates, self.stroke.get(int))
+        return render.polygon(self.surface.screen, self.color.rgb(), self.coordinates, self.stroke.get(int))
+
 
+class Arc(Reactive):
+    dependencies = ('start', 'end', 'radius', 'stroke')
 
-class Arc:
     def __init__(self, surface: Surface, start: coordinate, end: coordinate, radius: pixel, color: any='white', stroke: pixel=1, flip_orientation: bool=False, flip_direction: bool=False, z_index: int=9999):
         self.surface = surface
         self.start = get_values(start)
@@ -257,14 +289,12 @@ class Arc:
 
         self.flip_orientation = flip_orientation
         self.flip_direction = flip_direction
-
-        self.should_update = True
         self.update()
 
         surface.add_element(self, z_index)
     
-    def update(self) -> None:
-        if not self.should_update: return
+    def update(self, update_values: bool=False) -> None:
+        if not self.changed(): return
 
         a = self.start[0].get(), self.start[1].get()
         b = self.end[0].get(), self.end[1].get()
@@ -290,12 +320,17 @@ class Arc:
         self.start_angle = math.atan2(-av[1], av[0])
         self.end_angle = math.atan2(-bv[1], bv[0])
     
-    def show(self) -> None:
-        pygame.draw.arc(self.surface.screen, self.color.rgb(), self.rect, self.start_angle, self.end_angle, width=self.stroke.get(int))
+    def get_rect(self) -> rect:
+        return spatial.inflate(self.rect, self.stroke.get() + 2)
+
+    def show(self) -> pygame.Rect:
+        return render.arc(self.surface.screen, self.color.rgb(), self.rect, self.start_angle, self.end_angle, width=self.stroke.get(int))
 
 
 
-class AnimatedArc:
+class AnimatedArc(Reactive):
+    dependencies = ('start', 'end', 'radius', 't', 'stroke')
+
     def __init__(
         self, surface: Surface,
         start: coordinate, end: coordinate, radius: pixel,
@@ -316,12 +351,10 @@ class AnimatedArc:
         self.flip_orientation = flip_orientation
         self.flip_direction = flip_direction
 
-        self.should_update = True
-
         surface.add_element(self, z_index)
     
-    def update(self) -> None:
-        if not self.should_update: return
+    def update(self, update_values: bool=False) -> None:
+        if not self.changed(): return
 
         a = self.start[0].get(), self.start[1].get()
         b = self.end[0].get(), self.end[1].get()
@@ -349,12 +382,17 @@ class AnimatedArc:
 
         self.end_angle = self.start_angle + (self.end_angle - self.start_angle) * self.t.get()
     
-    def show(self) -> None:
+    def get_rect(self) -> rect:
+        return spatial.inflate(self.rect, self.stroke.get() + 2)
+
+    def show(self) -> pygame.Rect:
         self.update()
-        pygame.draw.arc(self.surface.screen, self.color.rgb(), self.rect, self.start_angle, self.end_angle, width=self.stroke.get(int))
+        return render.arc(self.surface.screen, self.color.rgb(), self.rect, self.start_angle, self.end_angle, width=self.stroke.get(int))
 
 
 class RegularPolygon(Polygon):
+    dependencies = ('x', 'y', 'radius', 'sides', 'phase', 'stroke')
+
     def __init__(
         self, surface: Surface,
         center: tuple[pixel, pixel], radius: pixel,
@@ -366,29 +404,17 @@ class RegularPolygon(Polygon):
         self.radius = get_value(radius)
         self.sides = get_value(sides)
         self.phase = get_value(phase)
-        self.should_update = type(self.sides) != Value or type(self.x) != Value or type(self.y) != Value or type(self.radius) != Value
         super().__init__(surface, [], color, stroke, start_time, z_index)
 
     def update(self, update_values: bool=False) -> None:
-        if not update_values:
-            if Clock.time < self.start_time or not self.should_update: return
-
-        offset = 1.5*math.pi - math.pi/self.sides
-        self.coordinates = np.zeros((180, 2))
-        phase = self.phase.get() + offset
-        d_angle = 2*math.pi/self.sides
-
-        for i in range(self.sides.get(int)):
-            a = int(180 * i /  self.sides)
-            b = int(180 * (i + 1) /  self.sides)
-            self.coordinates[a:b, 0] = self.x.get() + math.cos(d_angle * i + phase) * self.radius.get()
-            self.coordinates[a:b, 1] = self.y.get() + math.sin(d_angle * i + phase) * self.radius.get()
-        
-        self.coordinates[b:, 0] = self.x.get() + math.cos(d_angle * (i + 1) + phase) * self.radius.get()
-        self.coordinates[b:, 1] = self.y.get() + math.sin(d_angle * (i + 1) + phase) * self.radius.get()
+        if not update_values and Clock.time < self.start_time: return
+        if not self.changed(): return
+        self.coordinates = regular_polygon(self.x.get(), self.y.get(), self.radius.get(), self.sides.get(), self.phase.get())
 
 
 class AnimatedLine(Line):
+    dependencies = ('x0', 'y0', 'x1', 'y1', 'x', 'y', 'stroke')
+
     def __init__(
         self, surface: Surface,
         start: coordinate, end: coordinate,
@@ -410,12 +436,17 @@ class AnimatedLine(Line):
 
         if self.y.t != 1: self.y1.value = self.y0.get() + dy
         else: self.y.value = self.y0.get() + dy
+        self.touch()
         self.mid = self.x0.lerp(self.x1, 0.5), self.y0.lerp(self.y1, 0.5)
 
-    def show(self) -> None:
+    def get_rect(self) -> rect:
+        x0, y0, x1, y1 = self.x0.get(), self.y0.get(), self.x.get(), self.y.get()
+        return spatial.inflate((min(x0, x1), min(y0, y1), abs(x1 - x0), abs(y1 - y0)), self.stroke.get() + 2)
+
+    def show(self) -> pygame.Rect|None:
         if Clock.time < self.start_time: return
         start, end = (self.x0.get(), self.y0.get()), (self.x.get(), self.y.get())
-        getattr(self, f'show_{self.line_type}')(start, end)   
+        return getattr(self, f'show_{self.line_type}')(start, end)   
 
 
 class AnimatedLines:
@@ -433,6 +464,8 @@ class AnimatedLines:
             accumulated_lengths.append(math.hypot(x1 - x0, y1 - y0) + accumulated_lengths[-1])
         
         self.t_values = [length/accumulated_lengths[-1] for length in accumulated_lengths]
+        self.t_steps = np.diff(self.t_values)
+        self.vertices = np.asarray(points, dtype=float)
 
         self.surface = surface
         self.points = points
@@ -443,25 +476,20 @@ class AnimatedLines:
 
         surface.add_element(self, z_index)
 
-    def draw_line(self, index: int) -> None:
-        time_t = (Clock.time - self.start_time) / self.transition_time - self.t_values[index]
-        if time_t < 0: return
-
-        total_t = self.t_values[index+1] - self.t_values[index]
-        t = time_t / total_t
-        (x0, y0), (x1, y1) = self.points[index], self.points[index + 1]
-
-        if t >= 1:
-            return pygame.draw.line(self.surface.screen, self.color.rgb(), (x0, y0), (x1, y1), self.stroke.get(int))
-        
-        x, y = x0 + (x1 - x0) * t, y0 + (y1 - y0) * t
-        pygame.draw.line(self.surface.screen, self.color.rgb(), (x0, y0), (x, y), self.stroke.get(int))
+    def is_animated(self) -> bool:
+        return Clock.time < self.start_time + self.transition_time
 
-    def show(self) -> None:
+    def show(self) -> pygame.Rect|None:
         if Clock.time < self.start_time: return
+        time_t = (Clock.time - self.start_time) / self.transition_time - np.asarray(self.t_values[:-1])
+        count = np.count_nonzero(time_t >= 0)
+        if count == 0: return None
 
-        for i in range(len(self.points) - 1):
-            self.draw_line(i)
+        starts, ends = self.vertices[:count], self.vertices[1:count + 1]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t = (time_t[:count] / self.t_steps[:count])[:, None]
+            ends = np.where(t >= 1, ends, starts + (ends - starts) * t)
+        return render.segments(self.surface.screen, self.color.rgb(), np.stack((starts, ends), axis=1), self.stroke.get(int))
 
 
 class Group:
@@ -519,24 +547,26 @@ class Letter:
         if not update_values:
             if Clock.time < self.start_time: return
 
-        self.font = pygame.font.SysFont(self.font_name, self.font_size)
-        self.text = self.font.render(self.font_text, True, self.color.rgb())
-        self.rect = self.text.get_rect(topleft=(self.x.get(), self.y.get()))
+        self.font = fonts.get_font(self.font_name, self.font_size)
+        if isinstance(self.color, LerpColor) and self.color.t < 1:
+            self.text = fonts.tint(fonts.get_mask(self.font_name, Render.pixels(self.font_size), self.font_text), self.color.rgb())
+        else: self.text = fonts.render(self.font_name, Render.pixels(self.font_size), self.font_text, self.color.rgb())
+        self.rect = Render.get_rect(self.text, topleft=(self.x.get(), self.y.get()))
     
     def update_rect(self) -> None:
-        self.rect = self.text.get_rect(topleft=(self.x.get(), self.y.get()))
+        self.rect = Render.get_rect(self.text, topleft=(self.x.get(), self.y.get()))
     
-    def show(self) -> None:
+    def show(self) -> pygame.Rect:
         if self.background:
-            pygame.draw.rect(self.surface.screen, self.background.rgb(), self.rect)
-        self.surface.screen.blit(self.text, self.rect)
+            render.rect(self.surface.screen, self.background.rgb(), self.rect)
+        return render.blit(self.surface.screen, self.text, self.rect)
     
     def __setattr__(self, name: str, value: any) -> None:
         if name == 'color':
             color = get_color(value)
             if not hasattr(self, 'color'):
                 return super().__setattr__(name, color)
-            if type(self.color) == LerpColor:
+            if isinstance(self.color, LerpColor):
                 return setattr(self.color, 'end', color)
             return super().__setattr__(name, color)
 
@@ -577,11 +607,12 @@ class Text:
             self.parse_line(line, index, len(text))
         
         self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
+        self.surface.add_element(self, self.z_index)
 
     def parse_line(self, line: str, line_index: int, lines_number: int) -> None:
         width = 0
         x = self.start_x
-        height = pygame.font.SysFont(self.font, self.size).get_height()
+        height = fonts.get_font(self.font, self.size).get_height()
 
         for letter in line:
             self.letters.append(Letter(self.surface, letter, x, self.start_y+height*line_index, self.size, self.color, self.background, self.font, self.start_time))
@@ -606,8 +637,6 @@ class Text:
         for letter in self.letters[-len(line):]:
             letter.x += offset_x
             letter.y += offset_y
-        
-        self.surface.add_element(self, self.z_index)
 
     def displace_by(self, dx: pixel, dy: pixel, start_time: float=0, transition_time: float=0) -> Text:
         if start_time == 0:
@@ -632,10 +661,15 @@ class Text:
 
     def update(self, update_values: bool=False) -> None:
         for letter in self.letters: letter.update()
+
+    def get_rect(self) -> rect|None:
+        if not self.letters: return None
+        rects = [letter.rect for letter in self.letters]
+        return tuple(rects[0].unionall(rects[1:]).inflate(4, 4))
     
-    def show(self) -> None:
+    def show(self) -> pygame.Rect|None:
         if Clock.time < self.start_time: return
-        for letter in self.letters: letter.show()
+        return union_rects([letter.show() for letter in self.letters])
         # pygame.draw.rect(self.surface.screen, 'white', self.rect, width=1)
     
     def __getitem__(self, index: int|slice|str) -> Letter:
@@ -691,18 +725,21 @@ class FastText:
         self.surface = surface
         self.color = get_color(color)
         # background = get_color(background)
-        self.font = pygame.font.SysFont(font, size)
-        self.text = self.font.render(text, True, self.color.rgb())
-        self.rect = self.text.get_rect(**{anchor_x: x, anchor_y: y})
+        self.font = fonts.get_font(font, size)
+        self.text = fonts.render(font, Render.pixels(size), text, self.color.rgb())
+        self.rect = Render.get_rect(self.text, **{anchor_x: x, anchor_y: y})
         self.start_time = start_time
 
-        self.height = self.text.get_height()
+        self.height = self.rect.height
 
         surface.add_element(self, z_index)
     
-    def show(self) -> None:
+    def get_rect(self) -> rect:
+        return tuple(self.rect.inflate(4, 4))
+
+    def show(self) -> pygame.Rect|None:
         if Clock.time < self.start_time: return
-        self.surface.screen.blit(self.text, self.rect)
+        return render.blit(self.surface.screen, self.text, self.rect)
     
     def displace_by(self, dx: pixel, dy: pixel, start_time: float=0, transition_time: float=0) -> FastText:
         if start_time != 0:
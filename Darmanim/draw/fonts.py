@@ -0,0 +1,45 @@
+import pygame
+from collections import OrderedDict
+
+type rgb = tuple[int, int, int]
+
+fonts: dict[tuple[str, int], pygame.font.Font] = {}
+masks: dict[tuple[str, int, str], pygame.Surface] = {}
+glyphs: OrderedDict[tuple[str, int, str, rgb], pygame.Surface] = OrderedDict()
+max_glyphs = 4096
+
+
+def get_font(name: str, size: int) -> pygame.font.Font:
+    key = (name, size)
+    if key not in fonts: fonts[key] = pygame.font.SysFont(name, size)
+    return fonts[key]
+
+
+def get_mask(name: str, size: int, text: str) -> pygame.Surface:
+    key = (name, size, text)
+    if key not in masks: masks[key] = get_font(name, size).render(text, True, (255, 255, 255))
+    return masks[key]
+
+
+def tint(mask: pygame.Surface, color: rgb) -> pygame.Surface:
+    glyph = mask.copy()
+    glyph.fill((*color, 255), special_flags=pygame.BLEND_RGBA_MULT)
+    return glyph
+
+
+def render(name: str, size: int, text: str, color: rgb) -> pygame.Surface:
+    key = (name, size, text, color)
+    glyph = glyphs.get(key)
+    if glyph is not None:
+        glyphs.move_to_end(key)
+        return glyph
+
+    glyph = glyphs[key] = tint(get_mask(name, size, text), color)
+    if len(glyphs) > max_glyphs: glyphs.popitem(last=False)
+    return glyph
+
+
+def clear() -> None:
+    fonts.clear()
+    masks.clear()
+    glyphs.clear()
@@ -1,7 +1,8 @@
 import pygame
+from Darmanim import render
 from Darmanim.draw import Text, FastText
 from Darmanim.time import Clock
-from Darmanim.window import Surface
+from Darmanim.window import Surface, union_rects
 from Darmanim.color import get_color
 from Darmanim.values import get_value
 
@@ -87,10 +88,10 @@ class Table:
         self.row_weights[row] = weight
         self.row_weight = sum(self.row_weights)
 
-    def show(self) -> None:
+    def show(self) -> pygame.Rect|None:
         if Clock.time < self.start_time: return
 
-        pygame.draw.rect(self.surface.screen, self.color.rgb(), (self.x, self.y-self.header_height, self.width, self.header_height), width=self.stroke)
+        rects = [render.rect(self.surface.screen, self.color.rgb(), (self.x, self.y-self.header_height, self.width, self.header_height), width=self.stroke)]
 
         y = self.y
         for i in range(self.rows):
@@ -99,8 +100,9 @@ class Table:
             for j in range(self.columns):
                 width = self.column_weights[j] / self.column_weight * self.width
                 rect = (x, y, width, height)
-                pygame.draw.rect(self.surface.screen, self.color.rgb(), rect, width=self.stroke)
+                rects.append(render.rect(self.surface.screen, self.color.rgb(), rect, width=self.stroke))
                 x += width
             y += height
 
-        pygame.draw.rect(self.surface.screen, self.color.rgb(), self.rect, width=self.stroke)
+        rects.append(render.rect(self.surface.screen, self.color.rgb(), self.rect, width=self.stroke))
+        return union_rects(rects)
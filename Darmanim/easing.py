@@ -0,0 +1,154 @@
+from __future__ import annotations
+from Darmanim import lazy
+
+np = lazy.load('numpy')
+
+type easing = Easing|str|callable|None
+
+
+class Easing:
+    resolution: int = 4096
+    cache: dict[any, Easing] = {}
+    tables: list[np.ndarray] = []
+    stacked: np.ndarray|None = None
+
+    def __init__(self, function: callable, name: str=''):
+        self.name = name
+        t = np.linspace(0, 1, Easing.resolution)
+        try: self.table = np.asarray(function(t), dtype=float)
+        except TypeError: self.table = np.array([function(x) for x in t.tolist()], dtype=float)
+        self.table[0], self.table[-1] = 0, 1
+        self.values = self.table.tolist()
+        self.index = len(Easing.tables) + 1
+        Easing.tables.append(self.table)
+        Easing.stacked = None
+
+    def __call__(self, t: any) -> any:
+        if isinstance(t, np.ndarray): return np.interp(t, np.linspace(0, 1, Easing.resolution), self.table)
+        if t <= 0: return 0
+        if t >= 1: return 1
+
+        x = t * (Easing.resolution - 1)
+        i = int(x)
+        a = self.values[i]
+        return a + (self.values[i + 1] - a) * (x - i)
+
+    def lookup(indices: np.ndarray, t: np.ndarray) -> np.ndarray:
+        if Easing.stacked is None: Easing.stacked = np.concatenate([np.zeros(Easing.resolution)] + Easing.tables)
+
+        x = np.clip(t, 0, 1) * (Easing.resolution - 1)
+        i = np.minimum(x.astype(int), Easing.resolution - 2)
+        i += indices * Easing.resolution
+        a = Easing.stacked[i]
+        return np.where(t >= 1, 1, a + (Easing.stacked[i + 1] - a) * (x - (i % Easing.resolution)))
+
+    def get(key: any, function: callable, name: str='') -> Easing:
+        if key not in Easing.cache: Easing.cache[key] = Easing(function, name)
+        return Easing.cache[key]
+
+    def __repr__(self) -> str:
+        return f'Easing({self.name})'
+
+
+def get_easing(value: easing) -> Easing|callable|None:
+    if not isinstance(value, str): return value
+    if value not in easings: raise ValueError(f'unknown easing {value!r}, expected one of {", ".join(easings)}')
+    return easings[value]()
+
+
+def has_table(value: easing) -> bool:
+    return value is None or isinstance(value, (Easing, str))
+
+
+def get_index(value: easing) -> int:
+    value = get_easing(value)
+    if value is None: return 0
+    if not isinstance(value, Easing): raise TypeError(f'only named easings have a lookup table, got {value!r}')
+    return value.index
+
+
+def power_in(power: float=2) -> Easing:
+    return Easing.get(('in', power), lambda t: t ** power, f'in {power}')
+
+
+def power_out(power: float=2) -> Easing:
+    return Easing.get(('out', power), lambda t: 1 - (1 - t) ** power, f'out {power}')
+
+
+def power_in_out(power: float=2) -> Easing:
+    return Easing.get(
+        ('in_out', power),
+        lambda t: np.where(t < 0.5, 2 ** (power - 1) * t ** power, 1 - (2 - 2 * t) ** power / 2),
+        f'in_out {power}'
+    )
+
+
+def sine_in() -> Easing:
+    return Easing.get('sine_in', lambda t: 1 - np.cos(t * np.pi / 2), 'sine_in')
+
+
+def sine_out() -> Easing:
+    return Easing.get('sine_out', lambda t: np.sin(t * np.pi / 2), 'sine_out')
+
+
+def sine_in_out() -> Easing:
+    return Easing.get('sine_in_out', lambda t: (1 - np.cos(t * np.pi)) / 2, 'sine_in_out')
+
+
+def cubic_bezier(x1: float, y1: float, x2: float, y2: float) -> Easing:
+    if not (0 <= x1 <= 1 and 0 <= x2 <= 1): raise ValueError(f'cubic bezier x coordinates must be within [0, 1], got {x1} and {x2}')
+
+    def function(t: np.ndarray) -> np.ndarray:
+        s = np.linspace(0, 1, 4 * len(t))
+        x = 3 * (1 - s) ** 2 * s * x1 + 3 * (1 - s) * s ** 2 * x2 + s ** 3
+        y = 3 * (1 - s) ** 2 * s * y1 + 3 * (1 - s) * s ** 2 * y2 + s ** 3
+        return np.interp(t, x, y)
+
+    return Easing.get(('cubic_bezier', x1, y1, x2, y2), function, f'cubic_bezier {x1} {y1} {x2} {y2}')
+
+
+def spring(damping: float=6, frequency: float=3) -> Easing:
+    def function(t: np.ndarray) -> np.ndarray:
+        oscillation = lambda t: np.exp(-damping * t) * np.cos(2 * np.pi * frequency * t)
+        return 1 - oscillation(t) + t * oscillation(1)
+
+    return Easing.get(('spring', damping, frequency), function, f'spring {damping} {frequency}')
+
+
+def bounce(t: np.ndarray) -> np.ndarray:
+    n, d = 7.5625, 2.75
+    return np.select(
+        [t < 1 / d, t < 2 / d, t < 2.5 / d],
+        [n * t ** 2, n * (t - 1.5 / d) ** 2 + 0.75, n * (t - 2.25 / d) ** 2 + 0.9375],
+        n * (t - 2.625 / d) ** 2 + 0.984375
+    )
+
+
+def bounce_in() -> Easing:
+    return Easing.get('bounce_in', lambda t: 1 - bounce(1 - t), 'bounce_in')
+
+
+def bounce_out() -> Easing:
+    return Easing.get('bounce_out', bounce, 'bounce_out')
+
+
+def bounce_in_out() -> Easing:
+    return Easing.get('bounce_in_out', lambda t: np.where(t < 0.5, 1 - bounce(1 - 2 * t), 1 + bounce(2 * t - 1)) / 2, 'bounce_in_out')
+
+
+easings: dict[str, callable] = {
+    'ease_in': power_in,
+    'ease_out': power_out,
+    'ease_in_out': power_in_out,
+    'cubic_in': lambda: power_in(3),
+    'cubic_out': lambda: power_out(3),
+    'cubic_in_out': lambda: power_in_out(3),
+    'sine_in': sine_in,
+    'sine_out': sine_out,
+    'sine_in_out': sine_in_out,
+    'ease': lambda: cubic_bezier(0.25, 0.1, 0.25, 1),
+    'spring': spring,
+    'bounce_in': bounce_in,
+    'bounce_out': bounce_out,
+    'bounce_in_out': bounce_in_out
+}
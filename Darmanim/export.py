@@ -0,0 +1,83 @@
+from __future__ import annotations
+import os
+import sys
+import runpy
+import argparse
+import tempfile
+import subprocess
+import multiprocessing
+
+
+def run_scene(script: str, export: dict) -> dict:
+    from Darmanim.window import Window
+
+    Window.export = export
+    sys.path.insert(0, os.path.dirname(os.path.abspath(script)))
+    runpy.run_path(script, run_name='__main__')
+    return export
+
+
+def probe(script: str) -> dict:
+    context = multiprocessing.get_context('spawn')
+    with context.Pool(1) as pool:
+        return pool.apply(run_scene, (script, {'probe': True}))
+
+
+def split_frames(end_frame: int, chunks: int) -> list[tuple[int, int]]:
+    chunks = max(1, min(chunks, end_frame))
+    bounds = [round(end_frame * i / chunks) for i in range(chunks + 1)]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def concat(segments: list[str], output: str) -> None:
+    listing = os.path.join(os.path.dirname(segments[0]), 'segments.txt')
+    with open(listing, 'w') as f:
+        for segment in segments: f.write(f"file '{segment}'\n")
+
+    command = ['ffmpeg', '-y', '-f', 'concat', '-safe', '0', '-i', listing, '-c', 'copy', output]
+    subprocess.run(command, check=True)
+
+
+def export(script: str, output: str|None=None, workers: int|None=None, chunks: int|None=None, seek: bool=False) -> str:
+    workers = workers or os.cpu_count()
+    scene = probe(script)
+    if scene['end_frame'] is None:
+        raise ValueError(f'{script} has no record_time, so it cannot be split into chunks')
+
+    output = os.path.abspath(output or scene['output'])
+    ranges = split_frames(scene['end_frame'], chunks or workers)
+
+    with tempfile.TemporaryDirectory(dir=os.path.dirname(output)) as folder:
+        segments = [os.path.join(folder, f'segment_{i:04d}.mp4') for i in range(len(ranges))]
+        jobs = [
+            (script, {'start_frame': start, 'end_frame': end, 'output': segment, 'seek': seek})
+            for (start, end), segment in zip(ranges, segments)
+        ]
+
+        context = multiprocessing.get_context('spawn')
+        with context.Pool(workers, maxtasksperchild=1) as pool:
+            pool.starmap(run_scene, jobs, chunksize=1)
+
+        concat(segments, output)
+
+    return output
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Render a Darmanim scene in parallel chunks.')
+    parser.add_argument('script', help='scene script that builds a Window and calls run()')
+    parser.add_argument('-o', '--output', help='video file to write, defaults to the Window output')
+    parser.add_argument('-w', '--workers', type=int, help='worker processes, defaults to the CPU count')
+    parser.add_argument('-c', '--chunks', type=int, help='timeline chunks, defaults to the worker count')
+    parser.add_argument(
+        '--seek', action='store_true',
+        help='jump to each chunk start instead of replaying the frames before it; faster, but state built '
+        'frame by frame (Path traces, plotted groups) starts empty at every chunk boundary'
+    )
+    args = parser.parse_args()
+
+    print(export(args.script, args.output, args.workers, args.chunks, args.seek))
+
+
+if __name__ == '__main__':
+    main()
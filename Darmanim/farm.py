@@ -0,0 +1,190 @@
+from __future__ import annotations
+import os
+import ast
+import json
+import time
+import hashlib
+import argparse
+import traceback
+import multiprocessing
+from Darmanim.export import run_scene
+
+manifest_name = 'farm.json'
+excluded = ('Darmanim', 'benchmarks')
+
+
+def is_main_guard(node: ast.AST) -> bool:
+    if not isinstance(node, ast.If) or not isinstance(node.test, ast.Compare): return False
+    operands = [node.test.left] + node.test.comparators
+    return (
+        any(isinstance(operand, ast.Name) and operand.id == '__name__' for operand in operands) and
+        any(isinstance(operand, ast.Constant) and operand.value == '__main__' for operand in operands)
+    )
+
+
+def is_scene(script: str) -> bool:
+    try:
+        with open(script, encoding='utf-8') as f: tree = ast.parse(f.read(), script)
+    except (OSError, SyntaxError, UnicodeDecodeError): return False
+
+    for guard in filter(is_main_guard, tree.body):
+        for node in ast.walk(guard):
+            if not isinstance(node, ast.Call): continue
+            function = node.func
+            name = function.id if isinstance(function, ast.Name) else getattr(function, 'attr', None)
+            if name == 'Window': return True
+    return False
+
+
+def discover(paths: list[str]) -> list[str]:
+    scripts = []
+    for path in paths:
+        if os.path.isfile(path):
+            scripts.append(path)
+            continue
+
+        for folder, folders, files in os.walk(path):
+            folders[:] = sorted(name for name in folders if not name.startswith(('.', '__')) and name not in excluded)
+            scripts += [os.path.join(folder, name) for name in sorted(files) if name.endswith('.py')]
+
+    return [os.path.abspath(script) for script in scripts if is_scene(script)]
+
+
+def get_assets(script: str) -> list[str]:
+    with open(script, encoding='utf-8') as f: tree = ast.parse(f.read(), script)
+    folder = os.path.dirname(os.path.abspath(script))
+
+    assets = set()
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Constant) or not isinstance(node.value, str): continue
+        if len(node.value) > 255 or '\n' in node.value: continue
+        for path in (os.path.join(folder, node.value), node.value):
+            if os.path.isfile(path) and not path.endswith('.mp4'): assets.add(os.path.abspath(path))
+    return sorted(assets)
+
+
+def get_modules(script: str, folder: str|None=None, found: set[str]|None=None) -> list[str]:
+    folder = folder or os.path.dirname(os.path.abspath(script))
+    found = set() if found is None else found
+    try:
+        with open(script, encoding='utf-8') as f: tree = ast.parse(f.read(), script)
+    except (OSError, SyntaxError, UnicodeDecodeError): return sorted(found)
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import): names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level: names = [node.module] + [f'{node.module}.{alias.name}' for alias in node.names]
+        else: continue
+
+        parts = [name.split('.') for name in names]
+        for part in {tuple(part[:i]) for part in parts for i in range(1, len(part) + 1)}:
+            if part[0] == 'Darmanim': continue
+            base = os.path.join(folder, *part)
+            for path in (base + '.py', os.path.join(base, '__init__.py')):
+                if path in found or not os.path.isfile(path): continue
+                found.add(path)
+                get_modules(path, folder, found)
+    return sorted(found)
+
+
+def get_sources() -> list[str]:
+    folder = os.path.dirname(os.path.abspath(__file__))
+    return sorted(os.path.join(path, name) for path, folders, files in os.walk(folder) for name in files if name.endswith('.py'))
+
+
+def fingerprint(script: str, settings: dict) -> str:
+    digest = hashlib.sha256(json.dumps(settings, sort_keys=True).encode())
+    for path in [os.path.abspath(script)] + get_modules(script) + get_assets(script) + get_sources():
+        digest.update(path.encode())
+        with open(path, 'rb') as f: digest.update(f.read())
+    return digest.hexdigest()
+
+
+def get_output(script: str, root: str, output_dir: str) -> str:
+    relative = os.path.relpath(os.path.abspath(script), root)
+    if relative.startswith('..'): relative = os.path.basename(script)
+    return os.path.abspath(os.path.join(output_dir, os.path.splitext(relative)[0] + '.mp4'))
+
+
+def load_manifest(output_dir: str) -> dict:
+    try:
+        with open(os.path.join(output_dir, manifest_name)) as f: return json.load(f)
+    except (OSError, ValueError): return {}
+
+
+def render(script: str, export: dict) -> dict:
+    start = time.perf_counter()
+    try:
+        os.makedirs(os.path.dirname(export['output']), exist_ok=True)
+        run_scene(script, export)
+        status, error, reason = 'rendered', None, None
+    except Exception as e:
+        status, error, reason = 'failed', ''.join(traceback.format_exception_only(e)).strip(), None
+        if export.get('untimed'): status, error, reason = 'skipped', None, 'no record_time, pass --duration to render it'
+    return {'status': status, 'error': error, 'reason': reason, 'render_time': time.perf_counter() - start}
+
+
+def farm(
+    paths: list[str], output_dir: str='renders', size: tuple[int, int]|None=None, fps: int|None=None,
+    scale: float|None=None, duration: float|None=None, workers: int|None=None, force: bool=False
+) -> dict:
+    root = os.path.commonpath([os.path.abspath(path if os.path.isdir(path) else os.path.dirname(path)) for path in paths])
+    output_dir = os.path.abspath(output_dir)
+    settings = {key: value for key, value in (('size', size), ('fps', fps), ('scale', scale), ('duration', duration)) if value is not None}
+
+    manifest = load_manifest(output_dir)
+    scenes, jobs = {}, []
+    for script in discover(paths):
+        output = get_output(script, root, output_dir)
+        key = fingerprint(script, settings)
+        previous = manifest.get(script, {})
+
+        if not force and previous.get('fingerprint') == key and previous.get('status') in ('rendered', 'skipped') and (os.path.isfile(output) or previous.get('reason')):
+            scenes[script] = previous | {'status': 'skipped', 'render_time': 0}
+            continue
+
+        scenes[script] = {'output': output, 'fingerprint': key}
+        jobs.append((script, settings | {'output': output}))
+
+    context = multiprocessing.get_context('spawn')
+    with context.Pool(workers or os.cpu_count(), maxtasksperchild=1) as pool:
+        results = pool.starmap_async(render, jobs, chunksize=1)
+        for (script, export), result in zip(jobs, results.get()):
+            scenes[script] |= result
+
+    os.makedirs(output_dir, exist_ok=True)
+    with open(os.path.join(output_dir, manifest_name), 'w') as f: json.dump(manifest | scenes, f, indent=2)
+    return scenes
+
+
+def summary(scenes: dict) -> str:
+    width = max((len(script) for script in scenes), default=0)
+    lines = []
+    for script, scene in scenes.items():
+        line = f'{script:<{width}}  {scene["status"]:<8}  {scene["render_time"]:8.2f}s'
+        if scene.get('error') or scene.get('reason'): line += f'  {scene.get("error") or scene["reason"]}'
+        lines.append(line)
+
+    total = sum(scene['render_time'] for scene in scenes.values())
+    counts = {status: sum(scene['status'] == status for scene in scenes.values()) for status in ('rendered', 'skipped', 'failed')}
+    lines.append(f'{len(scenes)} scenes in {total:.2f}s of render time: ' + ', '.join(f'{count} {status}' for status, count in counts.items()))
+    return '\n'.join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Render every Darmanim scene script found in the given paths.')
+    parser.add_argument('paths', nargs='*', default=['.'], help='scene scripts or folders to search, defaults to the current folder')
+    parser.add_argument('-o', '--output-dir', default='renders', help='folder for the videos and the farm.json summary')
+    parser.add_argument('-s', '--size', type=int, nargs=2, metavar=('WIDTH', 'HEIGHT'), help='override the resolution of every scene')
+    parser.add_argument('--fps', type=int, help='override the frame rate of every scene')
+    parser.add_argument('--scale', type=float, help='render scale, below 1 for drafts and above 1 to supersample')
+    parser.add_argument('-d', '--duration', type=float, help='record time in seconds for scenes that do not set one')
+    parser.add_argument('-w', '--workers', type=int, help='worker processes, defaults to the CPU count')
+    parser.add_argument('-f', '--force', action='store_true', help='render scenes even if their output is up to date')
+    args = parser.parse_args()
+
+    size = tuple(args.size) if args.size else None
+    print(summary(farm(args.paths, args.output_dir, size, args.fps, args.scale, args.duration, args.workers, args.force)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+from __future__ import annotations
+import math
+import numpy as np
+
+polygon_resolution = 180
+polygon_tables: dict[float, np.ndarray] = {}
+max_polygon_tables = 512
+
+
+def get_polygon_table(sides: float) -> np.ndarray:
+    if sides not in polygon_tables:
+        if len(polygon_tables) >= max_polygon_tables: polygon_tables.clear()
+        starts = np.floor(polygon_resolution * np.arange(int(sides) + 1) / sides)
+        vertices = np.searchsorted(starts, np.arange(polygon_resolution), side='right') - 1
+        angles = 2*np.pi/sides * vertices + 1.5*np.pi - np.pi/sides
+        polygon_tables[sides] = np.column_stack((np.cos(angles), np.sin(angles)))
+    return polygon_tables[sides]
+
+
+def get_rotation(radius: float, phase: float) -> np.ndarray:
+    cos, sin = radius * math.cos(phase), radius * math.sin(phase)
+    return np.array([[cos, sin], [-sin, cos]])
+
+
+def regular_polygon(x: float, y: float, radius: float, sides: float, phase: float=0) -> np.ndarray:
+    return get_polygon_table(float(sides)) @ get_rotation(radius, phase) + (x, y)
+
+
+def regular_polygons(x: np.ndarray, y: np.ndarray, radius: np.ndarray, sides: np.ndarray, phase: np.ndarray) -> np.ndarray:
+    tables = np.stack([get_polygon_table(s) for s in np.asarray(sides, dtype=float).tolist()])
+    cos, sin = (radius * np.cos(phase))[:, None], (radius * np.sin(phase))[:, None]
+    px = tables[..., 0] * cos - tables[..., 1] * sin + np.asarray(x)[:, None]
+    py = tables[..., 0] * sin + tables[..., 1] * cos + np.asarray(y)[:, None]
+    return np.stack((px, py), axis=-1)
+
+
+def polygon_vertices(x: float, y: float, radius: float, sides: float, phase: float=0) -> np.ndarray:
+    count = math.ceil(sides) if sides % 1 else int(sides)
+    angles = 2*np.pi/sides * np.arange(count) + phase + 1.5*np.pi - np.pi/sides
+    return np.column_stack((x + np.cos(angles) * radius, y + np.sin(angles) * radius))
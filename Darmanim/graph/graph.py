@@ -1,18 +1,25 @@
 from __future__ import annotations
 import math
 import pygame
+import itertools
 import numpy as np
 import pygame.gfxdraw
 from Darmanim.time import Clock
-from Darmanim.window import Window
+from Darmanim.window import Window, union_rects
+from Darmanim.render import Render
+from Darmanim import render, spatial
+from Darmanim.profiler import Profiler
 from Darmanim.color import get_color
-from Darmanim.values import get_value, LerpValue, Event, Action, LerpEvent, ActionEvent, LerpEventGroup
+from Darmanim.values import get_value, LerpValue, Reactive, Event, Action, LerpEvent, ActionEvent, LerpEventGroup
 
 type unit = float
 type pixel = float
+type rect = tuple[pixel, pixel, pixel, pixel]
 
 
 class Grid:
+    versions = itertools.count()
+
     def __init__(
         self,
         minx: unit=-5, maxx: unit=5,
@@ -38,6 +45,7 @@ class Grid:
         self.y_stroke = y_stroke
 
         self.center = [0, 0]
+        self.version = next(Grid.versions)
 
     def square(
         size: unit,
@@ -71,8 +79,28 @@ class Grid:
 
         self.center[0] += dx
         self.center[1] += dy
+        if self.graph is not None: self.update_transform()
+
+    def update_transform(self) -> None:
+        sx = Render.length(self.graph.width) / self.x_len
+        sy = -Render.length(self.graph.height) / self.y_len
+        ox = (self.x_padding - self.minx) * sx
+        oy = (self.miny - self.y_padding) * sy
+
+        self.sx, self.sy, self.ox, self.oy = float(sx), float(sy), float(ox), float(oy)
+        self.scale = np.array([self.sx, self.sy])
+        self.offset = np.array([self.ox, self.oy])
+        self.transform = np.array([[self.sx, 0, self.ox], [0, self.sy, self.oy], [0, 0, 1]])
+        self.version = next(Grid.versions)
+
+    def to_pixel(self, x: unit, y: unit) -> tuple[pixel, pixel]:
+        return (x * self.sx + self.ox, y * self.sy + self.oy)
+
+    def to_pixels(self, points: np.ndarray) -> np.ndarray:
+        return points * self.scale + self.offset
 
     def update(self) -> None:
+        self.update_transform()
         minx, maxx = (self.minx - self.x_padding) / self.x_interval, (self.maxx + self.x_padding) / self.x_interval
         miny, maxy = (self.miny - self.y_padding) / self.y_interval, (self.maxy + self.y_padding) / self.y_interval
 
@@ -90,31 +118,33 @@ class Grid:
 
         dx = self.convert_dx_to_pixel(self.x_padding)
         dy = -self.convert_dy_to_pixel(self.y_padding)
-        self.rect = pygame.Rect(0, 0, self.graph.width, self.graph.height).inflate(-dx, -dy)
+        self.rect = pygame.Rect((0, 0), Render.size((self.graph.width, self.graph.height))).inflate(-dx, -dy)
 
     def convert_x_to_pixel(self, x: unit|np.array) -> pixel|np.array:
-        return (x - self.minx + self.x_padding) * self.graph.width / self.x_len
+        return x * self.sx + self.ox
 
     def convert_dx_to_pixel(self, dx: unit|np.array) -> pixel|np.array:
-        return self.convert_x_to_pixel(dx) - self.convert_x_to_pixel(0)
+        return dx * self.sx
 
     def convert_y_to_pixel(self, y: unit|np.array) -> pixel|np.array:
-        return (-y - self.miny + self.y_padding) * self.graph.height / self.y_len
+        return y * self.sy + self.oy
 
     def convert_dy_to_pixel(self, dy: unit|np.array) -> pixel|np.array:
-        return self.convert_y_to_pixel(dy) - self.convert_y_to_pixel(0)
+        return dy * self.sy
 
     def draw_x_lines(self) -> None:
-        for x in self.x_pixels:
-            if x < self.rect.left or x > self.rect.right: continue
-            pygame.draw.line(self.graph.surface, self.x_color.rgb(), (x, self.rect.top), (x, self.rect.bottom), self.x_stroke)
+        x = self.x_pixels[(self.x_pixels >= self.rect.left) & (self.x_pixels <= self.rect.right)]
+        top, bottom = np.full_like(x, self.rect.top), np.full_like(x, self.rect.bottom)
+        render.draw_segments(self.graph.surface, self.x_color.rgb(), np.column_stack((x, top, x, bottom)), Render.pixels(self.x_stroke))
+
+    def get_y_lines(self) -> np.ndarray:
+        return self.y_pixels % (self.rect.height - self.convert_dy_to_pixel(self.y_padding))
 
     def draw_y_lines(self) -> None:
-        y_padding = self.convert_dy_to_pixel(self.y_padding)
-        for y in self.y_pixels:
-            y = y % (self.rect.height - y_padding)
-            if y > self.rect.bottom or y < self.rect.top: continue
-            pygame.draw.line(self.graph.surface, self.y_color.rgb(), (self.rect.left, y), (self.rect.right, y), self.y_stroke)
+        y = self.get_y_lines()
+        y = y[(y >= self.rect.top) & (y <= self.rect.bottom)]
+        left, right = np.full_like(y, self.rect.left), np.full_like(y, self.rect.right)
+        render.draw_segments(self.graph.surface, self.y_color.rgb(), np.column_stack((left, y, right, y)), Render.pixels(self.y_stroke))
 
     def show(self) -> None:
         if self.x_color is not None: self.draw_x_lines()
@@ -173,18 +203,18 @@ class Arrow:
         x, y = self.x.get(), self.y.get()
         dx, dy = self.dx.get(), -self.dy.get()
 
-        x = self.x if self.static else self.graph.grid.convert_x_to_pixel(x)
-        y = self.y if self.static else self.graph.grid.convert_y_to_pixel(y)
+        if not self.static: x, y = self.graph.grid.to_pixel(x, y)
+        else: x, y = Render.point((x, y))
 
         center = pygame.Vector2(x, y)
         direction = pygame.Vector2(dx, dy).normalize()
-        width, height = self.width.get(), self.height.get()
+        width, height = Render.length(self.width.get()), Render.length(self.height.get())
         a = center + direction * height
         b = center + direction.rotate(90) * width/2
         c = center - direction.rotate(90) * width/2
 
         if self.fill is not None: pygame.draw.polygon(self.graph.surface, self.fill.rgb(), (a, b, c))
-        pygame.draw.polygon(self.graph.surface, self.color.rgb(), (a, b, c), self.stroke)
+        pygame.draw.polygon(self.graph.surface, self.color.rgb(), (a, b, c), Render.pixels(self.stroke))
 
 
 class Axis:
@@ -212,27 +242,150 @@ class Axis:
         self.graph = graph
         return self
 
+    def get_y_line(self) -> pixel|None:
+        if not self.mark_x_at_zero: return self.graph.grid.convert_x_to_pixel(self.graph.grid.minx)
+        if self.graph.grid.has_zero_in_x: return self.graph.grid.convert_x_to_pixel(0)
+        return None
+
+    def get_x_line(self) -> pixel|None:
+        if not self.graph.grid.has_zero_in_y: return self.graph.grid.convert_y_to_pixel(self.graph.grid.miny)
+        if self.mark_y_at_zero: return self.graph.grid.convert_y_to_pixel(0)
+        return None
+
     def draw_y_line(self) -> None:
-        if self.mark_x_at_zero: 
-            if self.graph.grid.has_zero_in_x: x = self.graph.grid.convert_x_to_pixel(0)
-            else: return
-        else: x = self.graph.grid.convert_x_to_pixel(self.graph.grid.minx)
+        x = self.get_y_line()
+        if x is None: return
         top, bottom = self.graph.grid.rect.top, self.graph.grid.rect.bottom
-        pygame.draw.line(self.graph.surface, self.y_axis_color.rgb(), (x, top), (x, bottom), self.y_axis_stroke)
+        pygame.draw.line(self.graph.surface, self.y_axis_color.rgb(), (x, top), (x, bottom), Render.pixels(self.y_axis_stroke))
     
     def draw_x_line(self) -> None:
-        if self.graph.grid.has_zero_in_y:
-            if self.mark_y_at_zero: y = self.graph.grid.convert_y_to_pixel(0)
-            else: return
-        else: y = self.graph.grid.convert_y_to_pixel(self.graph.grid.miny)
+        y = self.get_x_line()
+        if y is None: return
         left, right = self.graph.grid.rect.left, self.graph.grid.rect.right
-        pygame.draw.line(self.graph.surface, self.x_axis_color.rgb(), (left, y), (right, y), self.x_axis_stroke)
+        pygame.draw.line(self.graph.surface, self.x_axis_color.rgb(), (left, y), (right, y), Render.pixels(self.x_axis_stroke))
 
     def show(self) -> None:
         if self.x_axis_color: self.draw_x_line()
         if self.y_axis_color: self.draw_y_line()
 
 
+def get_rgb(color: any) -> tuple[int, int, int]|None:
+    return color.rgb() if color else None
+
+
+def get_shift(old: dict[float, int], new: dict[float, int]) -> int|None:
+    shifts = {pixel - old[value] for value, pixel in new.items() if value in old}
+    return shifts.pop() if len(shifts) == 1 else None
+
+
+class Background:
+    def __init__(self, graph: Graph|Plot, show_axis: bool=True):
+        self.graph = graph
+        self.show_axis = show_axis
+        self.layer = None
+        self.state = self.last_state = None
+        self.key = None
+        self.lines = (None, None)
+
+    def get_key(self) -> tuple:
+        graph, grid, axis = self.graph, self.graph.grid, self.graph.axis
+        key = (
+            graph.surface.get_size(), graph.color.rgb(),
+            get_rgb(grid.x_color), get_rgb(grid.y_color), grid.x_stroke, grid.y_stroke
+        )
+        if self.show_axis:
+            key += (get_rgb(axis.x_axis_color), get_rgb(axis.y_axis_color), axis.x_axis_stroke.get(), axis.y_axis_stroke.get())
+        return key, grid.version
+
+    def get_lines(self) -> tuple:
+        grid, axis = self.graph.grid, self.graph.axis
+        if self.lines[0] == grid.version: return self.lines[1]
+
+        x_lines = dict(zip(grid.x_range.tolist(), np.trunc(grid.x_pixels).astype(int).tolist())) if grid.x_color else {}
+        y_lines = dict(zip(grid.y_range.tolist(), np.trunc(grid.get_y_lines()).astype(int).tolist())) if grid.y_color else {}
+        axes = (None, None)
+        if self.show_axis:
+            x, y = axis.get_y_line(), axis.get_x_line()
+            axes = (None if x is None or not axis.y_axis_color else int(x), None if y is None or not axis.x_axis_color else int(y))
+
+        self.lines = (grid.version, ((tuple(grid.rect), grid.sx, grid.sy), x_lines, y_lines, axes))
+        return self.lines[1]
+
+    def get_state(self, key: tuple) -> tuple:
+        geometry, x_lines, y_lines, axes = self.get_lines()
+        return key[0] + geometry, x_lines, y_lines, axes
+
+    def render(self, clip: pygame.Rect|None=None) -> None:
+        surface = self.graph.surface
+        surface.set_clip(clip)
+        surface.fill(self.graph.color.rgb())
+        self.graph.grid.show()
+        if self.show_axis: self.graph.axis.show()
+        surface.set_clip(None)
+
+    def get_margin(self) -> int:
+        grid, axis = self.graph.grid, self.graph.axis
+        strokes = [grid.x_stroke, grid.y_stroke]
+        if self.show_axis: strokes += [axis.x_axis_stroke.get(), axis.y_axis_stroke.get()]
+        return int(Render.pixels(max(strokes))) + 2
+
+    def get_patches(self, dx: int, dy: int, axes: tuple[int|None, int|None]) -> list[pygame.Rect]:
+        width, height = self.layer.get_size()
+        margin = self.get_margin()
+        patches = []
+        if dx or dy:
+            rect = self.graph.grid.rect
+            inner = rect.clip(rect.move(dx, dy)).inflate(-2 * margin * bool(dx), -2 * margin * bool(dy))
+            if inner.width <= 0 or inner.height <= 0: return [self.layer.get_rect()]
+            if not dx: inner.left, inner.width = 0, width
+            if not dy: inner.top, inner.height = 0, height
+            patches += [
+                pygame.Rect(0, 0, width, inner.top), pygame.Rect(0, inner.bottom, width, height - inner.bottom),
+                pygame.Rect(0, inner.top, inner.left, inner.height), pygame.Rect(inner.right, inner.top, width - inner.right, inner.height)
+            ]
+
+        (old_x, old_y), (x, y) = self.state[3], axes
+        if old_x is not None: old_x += dx
+        if old_y is not None: old_y += dy
+        if old_x != x:
+            patches += [pygame.Rect(column - margin, 0, 2 * margin + 1, height) for column in (old_x, x) if column is not None]
+        if old_y != y:
+            patches += [pygame.Rect(0, row - margin, width, 2 * margin + 1) for row in (old_y, y) if row is not None]
+        return patches
+
+    def scroll(self, state: tuple) -> bool:
+        if self.layer is None or state[0] != self.state[0]: return False
+        dx = get_shift(self.state[1], state[1]) if state[1] else 0
+        dy = get_shift(self.state[2], state[2]) if state[2] else 0
+        if dx is None or dy is None: return False
+
+        surface, self.graph.surface = self.graph.surface, self.layer
+        self.layer.scroll(dx, dy)
+        for patch in self.get_patches(dx, dy, state[3]):
+            if patch.width > 0 and patch.height > 0: self.render(patch)
+        self.graph.surface = surface
+        self.state = state
+        return True
+
+    def show(self) -> None:
+        key = self.get_key()
+        if self.layer is not None and key == self.key:
+            self.graph.surface.blit(self.layer, (0, 0))
+            return
+
+        state = self.get_state(key)
+        if state == self.state or self.scroll(state):
+            self.graph.surface.blit(self.layer, (0, 0))
+            self.key = key
+            return
+
+        self.render()
+        if self.last_state is not None and state[0] == self.last_state[0]:
+            self.layer = self.graph.surface.copy()
+            self.state, self.key = state, key
+        self.last_state = state
+
+
 class Graph:
     def __init__(
         self, size: tuple[pixel, pixel],
@@ -240,10 +393,11 @@ class Graph:
         axis: Axis|None=None,
         color: any=None,
         border: any='border',
-        border_width: pixel=0
+        border_width: pixel=0,
+        culling: bool=True
     ):
         self.screen = None
-        self.surface = pygame.Surface(size)
+        self.surface = pygame.Surface(Render.size(size))
         self.width, self.height = size
 
         self.grid = grid.attach(self) if grid else Grid().attach(self)
@@ -252,8 +406,11 @@ class Graph:
         self.color = color
         self.border = get_color(border)
         self.border_width = border_width
+        self.background = Background(self)
 
         self.elements = []
+        self.culling = culling
+        self.index = spatial.SpatialIndex()
     
     def displace_to(self, x: pixel, y: pixel, start_time: float=0, transition_time: float=0) -> Graph:
         if start_time != 0:
@@ -292,8 +449,8 @@ class Graph:
             return self
         
         if transition_time == 0:
-            Event(self, 'width', width, start_time, update_element=True)
-            Event(self, 'height', height, start_time, update_element=True)
+            self.width, self.height = width, height
+            self.reshape_update()
         else:
             dx = (self.width - width) / 2 
             dy = (self.height - height) / 2 
@@ -306,39 +463,49 @@ class Graph:
             )
 
     def reshape_update(self) -> None:
-        self.surface = pygame.Surface((self.width, self.height))
+        self.surface = pygame.Surface(Render.size((self.width, self.height)))
         self.grid.update()
 
     def attach(self, window: Window, x: pixel|None=None, y: pixel|None=None) -> None:
         self.window = window
         self.screen = window.screen
+        self.culling = self.culling and getattr(window, 'culling', True)
         if self.color is None: self.color = window.color
-        if x is None: self.x = (self.screen.get_width() - self.width) / 2
+        if x is None: self.x = (window.width - self.width) / 2
         else: self.x = x
-        if y is None: self.y = (self.screen.get_height() - self.height) / 2
+        if y is None: self.y = (window.height - self.height) / 2
         else: self.y = y
 
     def draw_border(self) -> None:
         if (self.border is None) or (self.border_width == 0): return
-        pygame.draw.rect(self.surface, self.border.rgb(), (0, 0, self.width, self.height), width=self.border_width)
+        pygame.draw.rect(self.surface, self.border.rgb(), self.surface.get_rect(), width=Render.pixels(self.border_width))
 
-    def show(self) -> None:
-        self.surface.fill(self.color.rgb())
+    def cull(self) -> set[int]:
+        if not self.culling: return set()
+        return self.index.cull(self.elements, (0, 0, *self.surface.get_size()))
+
+    def update(self, update_values: bool=False) -> None:
+        for i, element in enumerate(self.elements):
+            if hasattr(element, 'update'): Profiler.call(element, 'update', f'{type(element).__name__}#{i}')
 
-        self.grid.show()
-        self.axis.show()
+    def show(self) -> pygame.Rect:
+        self.background.show()
 
-        for element in self.elements:
-            if hasattr(element, 'update'): element.update()
-            element.show()
+        rects = []
+        culled = self.cull()
+        for i, element in enumerate(self.elements):
+            if id(element) in culled: continue
+            rect = Profiler.call(element, 'show', f'{type(element).__name__}#{i}')
+            if getattr(element, 'cross_surface', False): rects.append(rect)
 
         self.draw_border()
-        self.screen.blit(self.surface, (self.x, self.y))
+        return union_rects([render.blit(self.screen, self.surface, (self.x, self.y))] + rects)
     
     def add(self, *elements: any) -> any:
         for element in elements:
             element.attach(self)
             self.elements.append(element)
+        self.index.clear()
         
         if len(elements) == 1: return elements[0]
         return elements
@@ -350,22 +517,12 @@ class BlankGraph(Graph):
         grid: Grid|None=None,
         color: any=None,
         border: any='border',
-        border_width: pixel=1
+        border_width: pixel=1,
+        culling: bool=True
     ):
         grid = BlankGrid() if grid is None else grid
-        super().__init__(size, grid, None, color, border, border_width)
-    
-    def show(self) -> None:
-        self.surface.fill(self.color.rgb())
-
-        self.grid.show()
-
-        for element in self.elements:
-            if hasattr(element, 'update'): element.update()
-            element.show()
-
-        self.draw_border()
-        self.screen.blit(self.surface, (self.x, self.y))
+        super().__init__(size, grid, None, color, border, border_width, culling)
+        self.background = Background(self, show_axis=False)
 
 
 class Function:
@@ -376,6 +533,9 @@ class Function:
         stroke: pixel=1,
         minx: unit|None=None, maxx: unit|None=None,
         animation_time: any=None,
+        call_update: bool=True,
+        adaptive: bool=False,
+        tolerance: pixel=0.5,
         **kwargs
     ):
         self.function = function
@@ -388,7 +548,12 @@ class Function:
         if animation_time is None: self.animation_time = animation_time
         else: self.animation_time = LerpValue(0, 1, animation_time)
 
+        self.call_update = call_update or getattr(function, 'animated', False)
+        self.adaptive = adaptive
+        self.tolerance = tolerance
+
         self.kwargs = kwargs
+        self.x_key = self.y_key = self.pixels_key = None
     
     def point_along(
         self, minx: unit=None, maxx: unit=None,
@@ -408,31 +573,82 @@ class Function:
     def set_kwargs(self, **kwargs) -> None:
         self.kwargs |= kwargs
 
+    def get_kwargs_key(self) -> tuple|None:
+        key = tuple(self.kwargs.items())
+        try: hash(key)
+        except TypeError: return None
+        return key
+
+    def get_max_points(self) -> int:
+        return max(2, int(Render.length(self.graph.width)))
+
+    def sample_fixed(self, minx: unit, maxx: unit, resolution: unit) -> None:
+        self.x = np.arange(minx, maxx, resolution)
+        self.y = self.function(self.x, **self.kwargs)
+
+    def sample_adaptive(self, minx: unit, maxx: unit) -> None:
+        max_points = self.get_max_points()
+        x = np.linspace(minx, maxx, min(65, max_points))
+        y = self.function(x, **self.kwargs)
+
+        while len(x) < max_points:
+            mid_x = (x[:-1] + x[1:]) / 2
+            mid_y = self.function(mid_x, **self.kwargs)
+
+            chord = self.graph.grid.convert_y_to_pixel((y[:-1] + y[1:]) / 2)
+            error = np.abs(self.graph.grid.convert_y_to_pixel(mid_y) - chord)
+            error[~np.isfinite(error)] = 0
+
+            refine = np.nonzero(error > Render.length(self.tolerance))[0]
+            if len(refine) == 0: break
+
+            budget = max_points - len(x)
+            if len(refine) > budget: refine = np.sort(refine[np.argsort(error[refine])[-budget:]])
+
+            x = np.insert(x, refine + 1, mid_x[refine])
+            y = np.insert(y, refine + 1, mid_y[refine])
+
+        self.x, self.y = x, y
+
     def update(self, update_values: bool=False) -> None:
         resolution = self.resolution.get()
         minx = (self.minx or self.graph.grid.minx) - self.graph.grid.x_padding/2
         maxx = (self.maxx or self.graph.grid.maxx) + self.graph.grid.x_padding/2
 
-        self.x = np.arange(minx, maxx, resolution)
-        self.y = self.function(self.x, **self.kwargs)
+        x_key = (minx, maxx, resolution, self.adaptive, self.graph.width, self.graph.height)
+        y_key = self.get_kwargs_key()
+        if self.call_update or y_key is None or (x_key, y_key) != (self.x_key, self.y_key):
+            if self.adaptive: self.sample_adaptive(minx, maxx)
+            elif x_key[:3] == (self.x_key or ())[:3]: self.y = self.function(self.x, **self.kwargs)
+            else: self.sample_fixed(minx, maxx, resolution)
+            self.x_key, self.y_key = x_key, y_key
+            self.pixels_key = None
 
+        y = self.y
         if self.animation_time:
             i = int(self.animation_time * len(self.x))
-            self.y[i:] = 0
-
-        self.x_pixels = self.graph.grid.convert_x_to_pixel(self.x)
-        self.y_pixels = self.graph.grid.convert_y_to_pixel(self.y)
-        self.coordinates = np.column_stack((self.x_pixels, self.y_pixels))
+            y = y.copy()
+            y[i:] = 0
+        
+        grid = self.graph.grid
+        if self.animation_time or grid.version != self.pixels_key:
+            self.coordinates = grid.to_pixels(np.column_stack((self.x, y)))
+            self.box = spatial.get_rect(self.coordinates)
+            self.pixels_key = grid.version
 
     def attach(self, graph: Graph) -> None:
         self.graph = graph
         self.update(update_values=True)
+
+    def get_rect(self) -> rect|None:
+        return spatial.inflate(self.box, Render.pixels(self.stroke.get()) + 2)
     
     def show(self) -> None:
-        if self.stroke == 1:
+        stroke = Render.pixels(self.stroke.get())
+        if stroke == 1:
             pygame.draw.aalines(self.graph.surface, self.color.rgb(), False, self.coordinates)
         else:
-            pygame.draw.lines(self.graph.surface, self.color.rgb(), False, self.coordinates, self.stroke.get(int))
+            pygame.draw.lines(self.graph.surface, self.color.rgb(), False, self.coordinates, int(stroke))
 
 
 class AxisLabels:
@@ -443,6 +659,46 @@ class AxisLabels:
         ...
 
 
+class RingBuffer:
+    def __init__(self, columns: int, max_length: int|None=None, capacity: int=256):
+        self.max_length = max_length
+        self.capacity = capacity if max_length is None else max_length
+        self.data = np.empty((2 * self.capacity, columns))
+        self.head = 0
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def view(self) -> np.ndarray:
+        return self.data[self.head:self.head + self.size]
+
+    def grow(self) -> None:
+        rows = self.view().copy()
+        self.capacity *= 2
+        self.data = np.empty((2 * self.capacity, self.data.shape[1]))
+        self.reset(rows)
+
+    def reset(self, rows: np.ndarray) -> None:
+        self.head, self.size = 0, len(rows)
+        self.data[:self.size] = rows
+        self.data[self.capacity:self.capacity + self.size] = rows
+
+    def append(self, row: tuple[float, ...]) -> None:
+        if self.size == self.capacity:
+            if self.max_length is None: self.grow()
+            else: self.drop(1)
+
+        i = (self.head + self.size) % self.capacity
+        self.data[i] = self.data[i + self.capacity] = row
+        self.size += 1
+
+    def drop(self, n: int) -> None:
+        n = min(n, self.size)
+        self.head = (self.head + n) % self.capacity
+        self.size -= n
+
+
 class Path:
     def __init__(
         self, point: Point,
@@ -450,7 +706,9 @@ class Path:
         fill: any=None,
         stroke: pixel=1,
         start_time: float=0,
-        plot_time: float=float('inf')
+        plot_time: float=float('inf'),
+        max_length: int|None=None,
+        max_age: float|None=None
     ):
         self.x, self.y = point.x, point.y
         self.color = get_color(color)
@@ -459,30 +717,47 @@ class Path:
 
         self.start_time = start_time
         self.plot_time = plot_time
-        self.x_points = np.array([])
-        self.y_points = np.array([])
+        self.max_age = max_age
 
+        self.points = RingBuffer(5, max_length)
+        self.pixels_key = None
         self.path = []
 
-    def update(self) -> None:
-        time = Clock.time - self.start_time
+    def get_bounds(self) -> tuple[unit, unit, unit, unit]:
+        grid = self.graph.grid
+        return (
+            grid.minx - grid.x_padding/2, grid.maxx + grid.x_padding/2,
+            grid.miny - grid.y_padding/2, grid.maxy + grid.y_padding/2
+        )
+
+    def refit(self) -> None:
+        grid = self.graph.grid
+        minx, maxx, miny, maxy = self.get_bounds()
 
-        if time >= self.plot_time or time < 0: return
-        self.x_points = np.append(self.x_points, self.x.get())
-        self.y_points = np.append(self.y_points, self.y.get())
+        points = self.points.view()
+        x, y = points[:, 0], points[:, 1]
+        points = points[(x > minx) & (x < maxx) & (y > miny) & (y < maxy)]
+        points[:, 3:] = grid.to_pixels(points[:, :2])
+        self.points.reset(points)
 
-        minx, maxx = self.graph.grid.minx - self.graph.grid.x_padding/2, self.graph.grid.maxx + self.graph.grid.x_padding/2
-        miny, maxy = self.graph.grid.miny - self.graph.grid.y_padding/2, self.graph.grid.maxy + self.graph.grid.y_padding/2
+    def update(self) -> None:
+        grid = self.graph.grid
+        if grid.version != self.pixels_key:
+            self.refit()
+            self.pixels_key = grid.version
 
-        mask = (self.x_points > minx) & (self.x_points < maxx) & (self.y_points > miny) & (self.y_points < maxy)
-        self.x_points = self.x_points[mask]
-        self.y_points = self.y_points[mask]
+        time = Clock.time - self.start_time
+        if 0 <= time < self.plot_time:
+            x, y = self.x.get(), self.y.get()
+            minx, maxx, miny, maxy = self.get_bounds()
+            if minx < x < maxx and miny < y < maxy:
+                self.points.append((x, y, Clock.time, *grid.to_pixel(x, y)))
 
-        x = self.graph.grid.convert_x_to_pixel(self.x_points)
-        y = self.graph.grid.convert_y_to_pixel(self.y_points)
-        self.path = np.column_stack((x, y))
+        if self.max_age is not None:
+            self.points.drop(np.searchsorted(self.points.view()[:, 2], Clock.time - self.max_age))
+
+        self.path = self.points.view()[:, 3:]
 
-    
     def attach(self, graph: Graph) -> Path:
         self.graph = graph
         return self
@@ -492,10 +767,11 @@ class Path:
         if self.fill is not None:
             pygame.draw.polygon(self.graph.surface, self.fill.rgb(), self.path)
         
-        if self.stroke == 1:
+        stroke = Render.pixels(self.stroke.get())
+        if stroke == 1:
             pygame.draw.aalines(self.graph.surface, self.color.rgb(), False, self.path)
         else:
-            pygame.draw.lines(self.graph.surface, self.color.rgb(), False, self.path, self.stroke.get(int))
+            pygame.draw.lines(self.graph.surface, self.color.rgb(), False, self.path, int(stroke))
 
 
 class Point:
@@ -543,17 +819,25 @@ class Point:
         self.graph = graph
         return self
 
+    def get_rect(self) -> rect:
+        x, y = self.graph.grid.to_pixel(self.x.get(), self.y.get())
+        radius = Render.length(self.radius.get()) + Render.pixels(self.stroke.get()) + 2
+        return (x - radius, y - radius, 2*radius, 2*radius)
+
     def show(self) -> None:
-        x = self.graph.grid.convert_x_to_pixel(self.x.get())
-        y = self.graph.grid.convert_y_to_pixel(self.y.get())
-        if self.fill: pygame.draw.circle(self.graph.surface, self.fill.rgb(), (x, y), self.radius)
-        pygame.draw.circle(self.graph.surface, self.color.rgb(), (x, y), self.radius, width=self.stroke)
+        x, y = self.graph.grid.to_pixel(self.x.get(), self.y.get())
+        radius = Render.length(self.radius)
+        if self.fill: pygame.draw.circle(self.graph.surface, self.fill.rgb(), (x, y), radius)
+        pygame.draw.circle(self.graph.surface, self.color.rgb(), (x, y), radius, width=Render.pixels(self.stroke))
     
     def __repr__(self) -> str:
         return f'Point({self.x}, {self.y})'
 
 
-class Line:
+class Line(Reactive):
+    dependencies = ('x0', 'y0', 'x1', 'y1', 'x', 'y', 'stroke')
+    pixels_key = None
+
     def __init__(
         self,
         start: tuple[unit, unit]|Point, end: tuple[unit, unit]|Point,
@@ -603,33 +887,44 @@ class Line:
         self.y = LerpValue(self.y0, self.y1, self.transition_time, self.start_time)
         return self
 
-    def show_cross_surface(self) -> None:
+    def show_cross_surface(self) -> pygame.Rect:
         x0, y0 = self.x0.get(), self.y0.get()
         if self.transition_time > 0: x1, y1 = self.x.get(), self.y.get()
         else: x1, y1 = self.x1.get(), self.y1.get()
 
-        start = [self.start.graph.grid.convert_x_to_pixel(x0), self.start.graph.grid.convert_y_to_pixel(y0)]
-        end = [self.end.graph.grid.convert_x_to_pixel(x1), self.end.graph.grid.convert_y_to_pixel(y1)]
+        start = list(self.start.graph.grid.to_pixel(x0, y0))
+        end = list(self.end.graph.grid.to_pixel(x1, y1))
 
-        start[0] += self.start.graph.x
-        start[1] += self.start.graph.y
-        end[0] += self.end.graph.x
-        end[1] += self.end.graph.y
+        start[0] += Render.length(self.start.graph.x)
+        start[1] += Render.length(self.start.graph.y)
+        end[0] += Render.length(self.end.graph.x)
+        end[1] += Render.length(self.end.graph.y)
         
-        pygame.draw.line(self.graph.screen, self.color.rgb(), start, end, width=self.stroke)
+        return pygame.draw.line(self.graph.screen, self.color.rgb(), start, end, width=Render.pixels(self.stroke))
 
-    def show(self) -> None:
-        if self.cross_surface: return self.show_cross_surface()
+    def update(self) -> None:
+        if self.cross_surface: return
+        grid = self.graph.grid
+        if not self.changed() and grid.version == self.pixels_key: return
 
         x0, y0 = self.x0.get(), self.y0.get()
         if self.transition_time > 0: x1, y1 = self.x.get(), self.y.get()
         else: x1, y1 = self.x1.get(), self.y1.get()
 
-        surface = self.graph.surface
-        start = [self.graph.grid.convert_x_to_pixel(x0), self.graph.grid.convert_y_to_pixel(y0)]
-        end = [self.graph.grid.convert_x_to_pixel(x1), self.graph.grid.convert_y_to_pixel(y1)]
-        
-        pygame.draw.line(surface, self.color.rgb(), start, end, width=self.stroke)
+        self.pixels = (grid.to_pixel(x0, y0), grid.to_pixel(x1, y1))
+        self.pixels_key = grid.version
+        self.touch()
+
+    def get_rect(self) -> rect|None:
+        if self.cross_surface: return None
+        (x0, y0), (x1, y1) = self.pixels
+        return spatial.inflate((min(x0, x1), min(y0, y1), abs(x1 - x0), abs(y1 - y0)), Render.pixels(self.stroke.get()) + 2)
+
+    def show(self) -> pygame.Rect|None:
+        if self.cross_surface: return self.show_cross_surface()
+
+        start, end = self.pixels
+        pygame.draw.line(self.graph.surface, self.color.rgb(), start, end, width=Render.pixels(self.stroke))
 
 
 class Lines:
@@ -3,6 +3,8 @@ import math
 import pygame
 import numpy as np
 from Darmanim.color import get_color
+from Darmanim.render import Render
+from Darmanim.geometry import regular_polygon, polygon_vertices
 from Darmanim.graph import Graph, Point, unit, pixel
 from Darmanim.values import get_value, LerpValue, ContinuosValue, Action, Event, LerpEvent
 
@@ -40,9 +42,7 @@ class Polygon:
 
     def update(self) -> None:
         if not hasattr(self, 'graph'): return
-        x = self.graph.grid.convert_x_to_pixel(self.points[:, 0])
-        y = self.graph.grid.convert_y_to_pixel(self.points[:, 1])
-        self.coordinates = np.column_stack((x, y))
+        self.coordinates = self.graph.grid.to_pixels(self.points)
 
     def attach(self, graph: Graph) -> Polygon:
         self.graph = graph
@@ -52,9 +52,10 @@ class Polygon:
     def show(self) -> None:
         self.update()
         if self.fill: pygame.draw.polygon(self.graph.surface, self.fill.rgb(), self.coordinates)
-        if self.stroke == 1:
+        stroke = Render.pixels(self.stroke)
+        if stroke == 1:
             return pygame.draw.aalines(self.graph.surface, self.color.rgb(), True, self.coordinates)
-        else: pygame.draw.polygon(self.graph.surface, self.color.rgb(), self.coordinates, width=self.stroke)
+        else: pygame.draw.polygon(self.graph.surface, self.color.rgb(), self.coordinates, width=int(stroke))
 
 
 class RegularPolygon(Polygon):
@@ -73,40 +74,12 @@ class RegularPolygon(Polygon):
         self.update()
     
     def update(self) -> None:
-        self.offset = 1.5*np.pi - np.pi/self.sides
-        self.points = np.zeros((180, 2))
-        phase = self.phase + self.offset
-        d_angle = 2*np.pi/self.sides
-
-        for i in range(self.sides.get(int)):
-            a = int(180 * i /  self.sides)
-            b = int(180 * (i + 1) /  self.sides)
-            self.points[a:b, 0] = self.x + math.cos(d_angle * i + phase) * self.radius
-            self.points[a:b, 1] = self.y + math.sin(d_angle * i + phase) * self.radius
-        
-        self.points[b:, 0] = self.x + math.cos(d_angle * (i + 1) + phase) * self.radius
-        self.points[b:, 1] = self.y + math.sin(d_angle * (i + 1) + phase) * self.radius
-
+        self.points = regular_polygon(self.x.get(), self.y.get(), self.radius.get(), self.sides.get(), self.phase.get())
         super().update()
     
     def get_points(self, radius: pixel=10, stroke: pixel=3, color: any='white', fill: any='black') -> list[Point]:
-        result = []
-
-        self.offset = 1.5*np.pi - np.pi/self.sides
-        phase = self.phase + self.offset
-        d_angle = 2*np.pi/self.sides
-
-        for i in range(self.sides.get(int)):
-            x = self.x + math.cos(d_angle * i + phase) * self.radius
-            y = self.y + math.sin(d_angle * i + phase) * self.radius
-            result.append(Point(x, y, radius, stroke, color, fill))
-        
-        if self.sides.get() % 1 == 0: return result
-        x = self.x + math.cos(d_angle * (i + 1) + phase) * self.radius
-        y = self.y + math.sin(d_angle * (i + 1) + phase) * self.radius
-        result.append(Point(x, y, radius, stroke, color, fill))
-
-        return result
+        vertices = polygon_vertices(self.x.get(), self.y.get(), self.radius.get(), self.sides.get(), self.phase.get())
+        return Point.from_list(vertices.tolist(), radius, stroke, color, fill)
 
 
 class Ellipse(Polygon):
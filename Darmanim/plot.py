@@ -1,8 +1,13 @@
 from __future__ import annotations
 import pygame
+import numpy as np
+from collections import OrderedDict
+from Darmanim import render
 from Darmanim.window import Surface
+from Darmanim.render import Render
 from Darmanim.color import get_color
-from Darmanim.graph import Grid, Axis
+from Darmanim.profiler import Profiler
+from Darmanim.graph import Grid, Axis, Background
 from Darmanim.values import get_value, Action, Event, LerpEvent, LerpValue, ActionEvent, LerpEventGroup
 
 type coordinate = list[tuple[float, float]]
@@ -26,15 +31,13 @@ class PlotPoint:
 
     def update(self) -> None:
         if not self.group: return
-        x = self.group.plot.grid.convert_x_to_pixel(self.x.get())
-        y = self.group.plot.grid.convert_y_to_pixel(self.y.get())
-        self.center = (x, y)
+        self.center = self.group.plot.grid.to_pixel(self.x.get(), self.y.get())
 
     def style(self, surface: pygame.Surface, center: tuple[float, float], radius: int, color: tuple[int, int, int]):
         pygame.draw.circle(surface, color, center, radius)
 
     def show(self) -> None:
-        self.style(self.group.plot.surface, self.center, self.radius.get(int), self.color.rgb())
+        self.style(self.group.plot.surface, self.center, Render.pixels(self.radius.get(int)), self.color.rgb())
     
     def __call__(self, *args, **kwargs) -> PlotPoint:
         group, x, y, _, _ = args
@@ -51,7 +54,7 @@ class Plot:
         border_width: pixel=1
     ):
         self.screen = None
-        self.surface = pygame.Surface(size)
+        self.surface = pygame.Surface(Render.size(size))
         self.width, self.height = size
 
         self.grid = grid.attach(self) if grid else Grid().attach(self)
@@ -60,12 +63,13 @@ class Plot:
         self.color = color
         self.border = get_color(border)
         self.border_width = border_width
+        self.background = Background(self)
 
         self.groups = []
     
     def draw_border(self) -> None:
         if (self.border is None) or (self.border_width == 0): return
-        pygame.draw.rect(self.surface, self.border.rgb(), (0, 0, self.width, self.height), width=self.border_width)
+        pygame.draw.rect(self.surface, self.border.rgb(), self.surface.get_rect(), width=Render.pixels(self.border_width))
 
     def displace_to(self, x: pixel, y: pixel, start_time: float=0, transition_time: float=0) -> Plot:
         if start_time != 0:
@@ -105,8 +109,8 @@ class Plot:
             return self
         
         if transition_time == 0:
-            Event(self, 'width', width, start_time, update_element=True)
-            Event(self, 'height', height, start_time, update_element=True)
+            self.width, self.height = width, height
+            self.reshape_update()
         else:
             dx = (self.width - width) / 2 
             dy = (self.height - height) / 2 
@@ -119,30 +123,28 @@ class Plot:
             )
 
     def reshape_update(self) -> None:
-        self.surface = pygame.Surface((self.width, self.height))
+        self.surface = pygame.Surface(Render.size((self.width, self.height)))
         self.grid.update()
         # for group in self.groups: group.update(True)
 
     def attach(self, surface: Surface, x: int|None=None, y: int|None=None) -> None:
         self.screen = surface.screen
         if self.color is None: self.color = surface.color
-        if x is None: self.x = (self.screen.get_width() - self.width) / 2
+        if x is None: self.x = (surface.width - self.width) / 2
         else: self.x = x
-        if y is None: self.y = (self.screen.get_height() - self.height) / 2
+        if y is None: self.y = (surface.height - self.height) / 2
         else: self.y = y
 
-    def show(self) -> None:
-        self.surface.fill(self.color.rgb())
-
-        self.grid.show()
-        self.axis.show()
+    def show(self) -> pygame.Rect:
+        self.background.show()
 
-        for group in self.groups:
-            group.update(True)
-            group.show()
+        for i, group in enumerate(self.groups):
+            label = f'{type(group).__name__}#{i}'
+            Profiler.call(group, 'update', label, True)
+            Profiler.call(group, 'show', label)
 
         self.draw_border()
-        self.screen.blit(self.surface, (self.x, self.y))
+        return render.blit(self.screen, self.surface, (self.x, self.y))
     
     def scatter(
         self, coordinates: list[tuple[float, float]],
@@ -164,30 +166,127 @@ class Plot:
         self.groups.append(group)
 
 
+markers: OrderedDict[tuple[int, tuple[int, int, int]], pygame.Surface] = OrderedDict()
+max_markers = 256
+footprints: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+stamp_threshold = 1000
+
+
+def get_marker(radius: int, color: tuple[int, int, int]) -> pygame.Surface:
+    key = (radius, color)
+    marker = markers.get(key)
+    if marker is not None:
+        markers.move_to_end(key)
+        return marker
+
+    marker = markers[key] = pygame.Surface((2*radius + 2, 2*radius + 2), pygame.SRCALPHA)
+    pygame.draw.circle(marker, color, (radius, radius), radius)
+    if len(markers) > max_markers: markers.popitem(last=False)
+    return marker
+
+
+def get_footprint(radius: int) -> tuple[np.ndarray, np.ndarray]:
+    footprint = footprints.get(radius)
+    if footprint is None:
+        if len(footprints) >= max_markers: footprints.clear()
+        footprint = footprints[radius] = np.nonzero(pygame.surfarray.array_alpha(get_marker(radius, (255, 255, 255))))
+    return footprint
+
+
+def stamp(surface: pygame.Surface, radius: int, color: tuple[int, int, int], corners: np.ndarray) -> None:
+    width, height = surface.get_size()
+    pad = 2*radius + 2
+
+    x, y = corners[:, 0] + pad, corners[:, 1] + pad
+    inside = (x >= 0) & (x < width + 2*pad) & (y >= 0) & (y < height + 2*pad)
+    seeds = np.zeros((width + 2*pad, height + 2*pad), dtype=bool)
+    seeds[x[inside], y[inside]] = True
+
+    mask = np.zeros((width, height), dtype=bool)
+    for dx, dy in zip(*get_footprint(radius)):
+        mask |= seeds[pad - dx:pad - dx + width, pad - dy:pad - dy + height]
+
+    pixels = pygame.surfarray.pixels2d(surface)
+    pixels[mask] = surface.map_rgb(color)
+    del pixels
+
+
+def is_static(coordinates: list[tuple[float, float]]) -> bool:
+    return all(isinstance(value, (int, float, np.number)) for coord in coordinates for value in coord)
+
+
 class ScatterGroup:
     def __init__(
         self, plot: Plot,
         coordinates: list[tuple[float, float]],
-        color: any, radius: int,
+        color: any, radius: int|list[int],
         call_update: bool, plot_style: any
     ):
         self.plot = plot
-        if isinstance(plot_style, type(lambda x: x)):
-            self.coordinates = []
-            for coord in coordinates:
-                self.coordinates.append(PlotPoint(self, *coord, color, radius))
-                self.coordinates[-1].style = plot_style
-        else: self.coordinates = [plot_style(self, *coord, color, radius) for coord in coordinates]
-
+        self.color = get_color(color)
         self.call_update = call_update
+        self.plot_style = plot_style
+        self.points = None
+        self.pixels_key = None
+
+        if plot_style is PlotPoint and is_static(coordinates):
+            self.x, self.y = np.array(coordinates, dtype=float).reshape(-1, 2).T
+            self.radii = np.broadcast_to(np.asarray(radius, dtype=int), self.x.shape)
+        else: self.create_points(coordinates, radius)
+
         self.update(update_values=True)
-    
+
+    def create_points(self, coordinates: list[tuple[float, float]], radius: int|list[int]) -> None:
+        radii = np.broadcast_to(np.asarray(radius, dtype=object), (len(coordinates),))
+        if isinstance(self.plot_style, type(lambda x: x)):
+            self.points = []
+            for coord, r in zip(coordinates, radii):
+                self.points.append(PlotPoint(self, *coord, self.color, r))
+                self.points[-1].style = self.plot_style
+        else: self.points = [self.plot_style(self, *coord, self.color, r) for coord, r in zip(coordinates, radii)]
+
+    @property
+    def coordinates(self) -> list[PlotPoint]:
+        if self.points is None: self.create_points(list(zip(self.x, self.y)), self.radii)
+        return self.points
+
+    def __len__(self) -> int:
+        return len(self.x) if self.points is None else len(self.points)
+
+    def __getitem__(self, index: int) -> PlotPoint:
+        return self.coordinates[index]
+
     def update(self, update_values: bool=False) -> None:
-        if not (self.call_update or update_values): return
-        for coord in self.coordinates: coord.update()
+        if self.points is not None:
+            if not (self.call_update or update_values): return
+            for coord in self.points: coord.update()
+            return
+
+        grid = self.plot.grid
+        if grid.version == self.pixels_key: return
+        self.pixels = grid.to_pixels(np.column_stack((self.x, self.y)))
+        self.pixels_key = grid.version
 
     def show(self) -> None:
-        for coord in self.coordinates: coord.show()
+        if self.points is not None:
+            for coord in self.points: coord.show()
+            return
+
+        if len(self) == 0: return
+        color = self.color.rgb()
+        radii = Render.pixels(self.radii)
+        corners = np.trunc(self.pixels).astype(int) - radii[:, None]
+        if np.all(radii == radii[0]):
+            if len(self) >= stamp_threshold and self.plot.surface.get_bytesize() == 4:
+                return stamp(self.plot.surface, int(radii[0]), color, corners)
+            marker = get_marker(int(radii[0]), color)
+            self.plot.surface.blits([(marker, corner) for corner in corners.tolist()], doreturn=False)
+            return
+
+        self.plot.surface.blits([
+            (get_marker(radius, color), corner)
+            for radius, corner in zip(radii.tolist(), corners.tolist())
+        ], doreturn=False)
 
 
 class PlotGroup(ScatterGroup):
@@ -205,14 +304,14 @@ class PlotGroup(ScatterGroup):
         self.stroke = get_value(stroke)
 
         self.fill = get_color(fill) if len(coordinates) >= 3 else None
-        self.color = get_color(color)
 
     def update(self, update_values: bool=False) -> None:
         super().update(update_values)
-        if len(self.coordinates) < 2: return
-        self.lines = [coord.get() for coord in self.coordinates]
+        if len(self) < 2: return
+        if self.points is None: self.lines = self.pixels
+        else: self.lines = [coord.get() for coord in self.points]
 
     def show(self) -> None:
         if self.fill: pygame.draw.polygon(self.plot.surface, self.fill.rgb(), self.lines)
-        pygame.draw.lines(self.plot.surface, self.color.rgb(), self.closed, self.lines, width=self.stroke.get(int))
+        pygame.draw.lines(self.plot.surface, self.color.rgb(), self.closed, self.lines, width=Render.pixels(self.stroke.get(int)))
         super().show()
\ No newline at end of file
@@ -0,0 +1,120 @@
+import json
+import time
+import pygame
+
+type stats = dict[str, list[float]]
+
+
+def add_sample(table: stats, key: str, elapsed: float) -> None:
+    if key not in table: table[key] = [0, 0, 0]
+    sample = table[key]
+    sample[0] += 1
+    sample[1] += elapsed
+    sample[2] = max(sample[2], elapsed)
+
+
+def summarize(table: stats, frames: int) -> dict[str, dict[str, float]]:
+    frames = max(frames, 1)
+    rows = sorted(table.items(), key=lambda item: item[1][1], reverse=True)
+    return {key: {
+        'calls': calls, 'total_ms': total * 1000,
+        'per_frame_ms': total * 1000 / frames, 'max_ms': peak * 1000
+    } for key, (calls, total, peak) in rows}
+
+
+class Profiler:
+    enabled: bool = False
+    output: str = ''
+    overlay: bool = False
+    frames: int = 0
+    stack: list[list] = []
+    folded: dict[str, float] = {}
+    phases: stats = {}
+    classes: stats = {}
+    instances: stats = {}
+    last: dict[str, float] = {}
+    font: pygame.font.Font|None = None
+
+    def start(output: str='', overlay: bool=False) -> None:
+        Profiler.clear()
+        Profiler.enabled = True
+        Profiler.output = output
+        Profiler.overlay = overlay
+
+    def clear() -> None:
+        Profiler.frames = 0
+        Profiler.stack.clear()
+        Profiler.folded.clear()
+        Profiler.phases.clear()
+        Profiler.classes.clear()
+        Profiler.instances.clear()
+        Profiler.last.clear()
+
+    def begin(name: str, group: str|None=None) -> None:
+        if not Profiler.enabled: return
+        Profiler.stack.append([name, group, time.perf_counter(), 0])
+
+    def end() -> None:
+        if not Profiler.enabled: return
+        name, group, start, children = Profiler.stack.pop()
+        elapsed = time.perf_counter() - start
+        path = ';'.join([frame[0] for frame in Profiler.stack] + [name])
+        Profiler.folded[path] = Profiler.folded.get(path, 0) + elapsed - children
+        if Profiler.stack: Profiler.stack[-1][3] += elapsed
+
+        if group is None:
+            if len(Profiler.stack) == 1: add_sample(Profiler.phases, name, elapsed)
+            Profiler.last[name] = elapsed
+            return
+
+        add_sample(Profiler.classes, group, elapsed)
+        add_sample(Profiler.instances, path, elapsed)
+
+    def begin_frame() -> None:
+        if not Profiler.enabled: return
+        Profiler.last.clear()
+        Profiler.begin('frame')
+
+    def end_frame() -> None:
+        if not Profiler.enabled: return
+        Profiler.end()
+        Profiler.frames += 1
+
+    def call(element: any, method: str, label: str, *args) -> any:
+        if not Profiler.enabled: return getattr(element, method)(*args)
+        Profiler.begin(label, type(element).__name__)
+        try: result = getattr(element, method)(*args)
+        except Exception:
+            Profiler.stack.pop()
+            raise
+        Profiler.end()
+        return result
+
+    def report() -> dict[str, any]:
+        return {
+            'frames': Profiler.frames,
+            'phases': summarize(Profiler.phases, Profiler.frames),
+            'classes': summarize(Profiler.classes, Profiler.frames),
+            'instances': summarize(Profiler.instances, Profiler.frames)
+        }
+
+    def save(output: str) -> None:
+        with open(output, 'w') as file:
+            if output.endswith('.json'): return json.dump(Profiler.report(), file, indent=4)
+            for path, elapsed in Profiler.folded.items():
+                file.write(f'{path} {round(elapsed * 1e6)}\n')
+
+    def draw_overlay(screen: pygame.Surface) -> pygame.Rect|None:
+        if not (Profiler.enabled and Profiler.overlay): return None
+        if Profiler.font is None: Profiler.font = pygame.font.SysFont('Arial', 16)
+
+        slowest = sorted(Profiler.instances.items(), key=lambda item: item[1][2], reverse=True)[:5]
+        lines = [f'{name}: {elapsed * 1000:.2f} ms' for name, elapsed in Profiler.last.items()]
+        lines += [f'{path.split(";")[-1]}: max {sample[2] * 1000:.2f} ms' for path, sample in slowest]
+
+        rects = []
+        for i, line in enumerate(lines):
+            text = Profiler.font.render(line, True, 'white', 'black')
+            rects.append(screen.blit(text, (screen.get_width() - text.get_width() - 10, 10 + 18 * i)))
+        if not rects: return None
+        return rects[0].unionall(rects[1:])
@@ -0,0 +1,126 @@
+from __future__ import annotations
+import pygame
+import numpy as np
+
+type pixel = float
+type coordinate = tuple[pixel, pixel]
+
+
+class Render:
+    scale: float = 1
+
+    def set_scale(scale: float) -> None:
+        if scale <= 0: raise ValueError(f'render scale must be positive, got {scale}')
+        Render.scale = scale
+
+    def length(value: pixel) -> pixel:
+        if Render.scale == 1: return value
+        return value * Render.scale
+
+    def pixels(value: any) -> any:
+        if Render.scale == 1: return value
+        if isinstance(value, np.ndarray): return np.where(value > 0, np.maximum(1, np.rint(value * Render.scale)), 0).astype(int)
+        return max(1, round(value * Render.scale)) if value > 0 else 0
+
+    def size(size: tuple[pixel, pixel]) -> tuple[int, int]:
+        if Render.scale == 1: return size
+        return (round(size[0] * Render.scale), round(size[1] * Render.scale))
+
+    def point(point: coordinate) -> coordinate:
+        if Render.scale == 1: return point
+        return (point[0] * Render.scale, point[1] * Render.scale)
+
+    def points(points: list[coordinate]) -> list[coordinate]|np.ndarray:
+        if Render.scale == 1: return points
+        return np.asarray(points, dtype=float) * Render.scale
+
+    def rect(rect: tuple[pixel, pixel, pixel, pixel]) -> tuple[pixel, pixel, pixel, pixel]:
+        if Render.scale == 1: return rect
+        x, y, width, height = rect
+        return (x * Render.scale, y * Render.scale, width * Render.scale, height * Render.scale)
+
+    def get_rect(surface: pygame.Surface, **kwargs) -> pygame.Rect:
+        if Render.scale == 1: return surface.get_rect(**kwargs)
+        width, height = surface.get_size()
+        rect = pygame.Rect(0, 0, round(width / Render.scale), round(height / Render.scale))
+        for name, value in kwargs.items(): setattr(rect, name, value)
+        return rect
+
+
+def line(surface: pygame.Surface, color: any, start: coordinate, end: coordinate, width: int=1) -> pygame.Rect:
+    return pygame.draw.line(surface, color, Render.point(start), Render.point(end), Render.pixels(width))
+
+
+def lines(surface: pygame.Surface, color: any, closed: bool, points: list[coordinate], width: int=1) -> pygame.Rect:
+    return pygame.draw.lines(surface, color, closed, Render.points(points), Render.pixels(width))
+
+
+def fill_segments(surface: pygame.Surface, color: any, segments: np.ndarray, vertical: np.ndarray, width: int) -> list[pygame.Rect]:
+    (x0, y0), (x1, y1) = segments.transpose(1, 2, 0)
+    rects = np.column_stack((
+        np.where(vertical, x0 - (width - 1) // 2, np.minimum(x0, x1)),
+        np.where(vertical, np.minimum(y0, y1), y0 - (width - 1) // 2),
+        np.where(vertical, width, np.abs(x1 - x0) + 1),
+        np.where(vertical, np.abs(y1 - y0) + 1, width)
+    )).astype(int).tolist()
+    return [surface.fill(color, rect) for rect in rects]
+
+
+def draw_segments(surface: pygame.Surface, color: any, segments: any, width: int=1) -> pygame.Rect|None:
+    segments = np.asarray(segments, dtype=float).reshape(-1, 2, 2)
+    clip, padding = surface.get_clip(), width + 1
+    left, top, right, bottom = clip.left, clip.top, clip.right, clip.bottom
+    low, high = np.minimum(segments[:, 0], segments[:, 1]), np.maximum(segments[:, 0], segments[:, 1])
+    visible = ((high >= (left - padding, top - padding)) & (low < (right + padding, bottom + padding))).all(axis=1)
+
+    rects = []
+    if width >= 1:
+        pixels = np.trunc(segments)
+        aligned = pixels[:, 0] == pixels[:, 1]
+        filled = aligned.any(axis=1)
+        if filled.any(): filled &= ((low >= (left + padding, top + padding)) & (high < (right - padding, bottom - padding))).all(axis=1)
+        if filled.any():
+            rects = fill_segments(surface, color, pixels[filled], aligned[filled, 0], width)
+            visible &= ~filled
+
+    points = segments[visible].tolist()
+    if not points: return rects[0].unionall(rects[1:]) if rects else None
+
+    line, lines = pygame.draw.line, pygame.draw.lines
+    path = points[0]
+    for start, end in points[1:] + [[None, None]]:
+        if start == path[-1]:
+            path.append(end)
+            continue
+        rects.append(line(surface, color, path[0], path[1], width) if len(path) == 2 else lines(surface, color, False, path, width))
+        path = [start, end]
+    return rects[0].unionall(rects[1:])
+
+
+def segments(surface: pygame.Surface, color: any, segments: any, width: int=1) -> pygame.Rect|None:
+    return draw_segments(surface, color, Render.points(np.asarray(segments, dtype=float)), Render.pixels(width))
+
+
+def polygon(surface: pygame.Surface, color: any, points: list[coordinate], width: int=0) -> pygame.Rect:
+    return pygame.draw.polygon(surface, color, Render.points(points), Render.pixels(width))
+
+
+def circle(surface: pygame.Surface, color: any, center: coordinate, radius: pixel, width: int=0) -> pygame.Rect:
+    return pygame.draw.circle(surface, color, Render.point(center), Render.length(radius), Render.pixels(width))
+
+
+def ellipse(surface: pygame.Surface, color: any, rect: tuple, width: int=0) -> pygame.Rect:
+    return pygame.draw.ellipse(surface, color, Render.rect(rect), Render.pixels(width))
+
+
+def rect(surface: pygame.Surface, color: any, rect: tuple, width: int=0) -> pygame.Rect:
+    return pygame.draw.rect(surface, color, Render.rect(rect), Render.pixels(width))
+
+
+def arc(surface: pygame.Surface, color: any, rect: tuple, start_angle: float, stop_angle: float, width: int=1) -> pygame.Rect:
+    return pygame.draw.arc(surface, color, Render.rect(rect), start_angle, stop_angle, Render.pixels(width))
+
+
+def blit(target: pygame.Surface, source: pygame.Surface, position: any) -> pygame.Rect:
+    if Render.scale == 1: return target.blit(source, position)
+    return target.blit(source, Render.point((position[0], position[1])))
@@ -0,0 +1,128 @@
+from __future__ import annotations
+import math
+import numpy as np
+
+type rect = tuple[float, float, float, float]
+
+max_cells = 64
+
+
+def intersects(a: rect|None, b: rect) -> bool:
+    if a is None: return True
+    return a[0] < b[0] + b[2] and b[0] < a[0] + a[2] and a[1] < b[1] + b[3] and b[1] < a[1] + a[3]
+
+
+def inflate(rect: rect|None, padding: float) -> rect|None:
+    if rect is None: return None
+    x, y, width, height = rect
+    return (x - padding, y - padding, width + 2*padding, height + 2*padding)
+
+
+def get_rect(points: any, padding: float=0) -> rect|None:
+    points = np.asarray(points, dtype=float)
+    if len(points) == 0 or np.isnan(points).all(): return None
+    (x, y), (x1, y1) = np.nanmin(points, axis=0), np.nanmax(points, axis=0)
+    if not np.isfinite((x, y, x1, y1)).all(): return None
+    return (float(x - padding), float(y - padding), float(x1 - x + 2*padding), float(y1 - y + 2*padding))
+
+
+class SpatialIndex:
+    def __init__(self, cell_size: float=64):
+        self.cell_size = cell_size
+        self.cells: dict[tuple[int, int], set[int]] = {}
+        self.rects: dict[int, rect|None] = {}
+        self.large: set[int] = set()
+        self.polled: list[any] = []
+        self.touched: set[any] = set()
+        self.culled: set[int] = set()
+        self.viewport = None
+        self.built = False
+        self.moved = True
+
+    def get_cells(self, rect: rect|None) -> tuple[range, range]|None:
+        if rect is None or not all(map(math.isfinite, rect)): return None
+        x, y, width, height = rect
+        columns = range(math.floor(x / self.cell_size), math.floor((x + width) / self.cell_size) + 1)
+        rows = range(math.floor(y / self.cell_size), math.floor((y + height) / self.cell_size) + 1)
+        if len(columns) * len(rows) > max_cells: return None
+        return columns, rows
+
+    def insert(self, key: int, rect: rect|None) -> None:
+        self.rects[key] = rect
+        cells = self.get_cells(rect)
+        if cells is None:
+            self.large.add(key)
+            return
+
+        for column in cells[0]:
+            for row in cells[1]: self.cells.setdefault((column, row), set()).add(key)
+
+    def remove(self, key: int) -> None:
+        if key not in self.rects: return
+        rect = self.rects.pop(key)
+        if key in self.large: return self.large.discard(key)
+
+        columns, rows = self.get_cells(rect)
+        for column in columns:
+            for row in rows:
+                cell = self.cells[(column, row)]
+                cell.discard(key)
+                if not cell: del self.cells[(column, row)]
+
+    def move(self, key: int, rect: rect|None) -> None:
+        if key in self.rects and self.rects[key] == rect: return
+        self.remove(key)
+        self.insert(key, rect)
+        self.moved = True
+
+    def query(self, rect: rect) -> set[int]:
+        keys = {key for key in self.large if intersects(self.rects[key], rect)}
+        x, y, width, height = rect
+        size = self.cell_size
+        columns = range(math.floor(x / size), math.floor((x + width) / size) + 1)
+        rows = range(math.floor(y / size), math.floor((y + height) / size) + 1)
+        inner_columns = range(math.ceil(x / size), math.floor((x + width) / size))
+        inner_rows = range(math.ceil(y / size), math.floor((y + height) / size))
+
+        if len(columns) * len(rows) > len(self.cells):
+            cells = [(index, cell) for index, cell in self.cells.items() if index[0] in columns and index[1] in rows]
+        else: cells = [((column, row), self.cells[(column, row)]) for column in columns for row in rows if (column, row) in self.cells]
+
+        for (column, row), cell in cells:
+            if column in inner_columns and row in inner_rows: keys |= cell
+            else: keys.update(key for key in cell if key not in keys and intersects(self.rects[key], rect))
+        return keys
+
+    def build(self, elements: list[any]) -> None:
+        for element in elements:
+            get_rect = getattr(element, 'get_rect', None)
+            if get_rect is None: continue
+
+            if hasattr(element, 'touch'): element.spatial = self
+            else: self.polled.append(element)
+            self.move(id(element), get_rect())
+
+        self.touched.clear()
+        self.built = True
+
+    def cull(self, elements: list[any], viewport: rect) -> set[int]:
+        if not self.built: self.build(elements)
+        else:
+            touched, self.touched = self.touched, set()
+            for element in touched:
+                if id(element) in self.rects: self.move(id(element), element.get_rect())
+            for element in self.polled: self.move(id(element), element.get_rect())
+
+        if self.moved or viewport != self.viewport:
+            self.culled = self.rects.keys() - self.query(viewport)
+            self.moved, self.viewport = False, viewport
+        return self.culled
+
+    def clear(self) -> None:
+        self.cells.clear()
+        self.rects.clear()
+        self.large.clear()
+        self.polled.clear()
+        self.touched.clear()
+        self.built = False
+        self.moved = True
@@ -1,4 +1,7 @@
-import pygame
+import math
+from Darmanim import lazy
+
+pygame = lazy.load('pygame')
 
 type time = float|str
 
@@ -7,15 +10,32 @@ class Clock:
     dt: float = 0
     fps: int = 60
     time: float = 0
-    clock = pygame.time.Clock()
+    frame: int = 0
+    updated: int|None = None
+    clock = None
     
-    def tick() -> None:
-        Clock.clock.tick(Clock.fps)
+    def tick(throttle: bool=True) -> None:
+        if throttle: Clock.get_clock().tick(Clock.fps)
+        Clock.set_frame(Clock.frame + 1)
+
+    def set_frame(frame: int) -> None:
+        Clock.frame = frame
         Clock.dt = 1 / Clock.fps
-        Clock.time += Clock.dt
+        Clock.time = frame / Clock.fps
+
+    def birth_time() -> float:
+        if Clock.updated == Clock.frame: return max((Clock.frame + 1) / Clock.fps, 0)
+        return max(Clock.time, 0)
+
+    def frame_at(time: float) -> int:
+        return math.ceil(time * Clock.fps - 1e-6)
 
     def get_fps() -> float:
         return 1/Clock.fps * (Clock.time >= 0)
     
+    def get_clock() -> any:
+        if Clock.clock is None: Clock.clock = pygame.time.Clock()
+        return Clock.clock
+
     def get_real_fps() -> float:
-        return Clock.clock.get_fps()
\ No newline at end of file
+        return Clock.get_clock().get_fps()
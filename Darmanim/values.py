@@ -1,27 +1,150 @@
 from __future__ import annotations
+import heapq
+import itertools
+from Darmanim import lazy
 from Darmanim.time import Clock
+from Darmanim.batch import Batch
+from Darmanim.easing import easing, get_easing, get_index, has_table
+
+np = lazy.load('numpy')
+
+
+class Scheduler:
+    pending: list = []
+    pending_ids: set = set()
+    active: dict = {}
+    retired: int = 0
+    queue: list|None = None
+    counter = itertools.count()
+    targets: tuple[int, set[int]|None] = (None, set())
+    version: int = 0
+    touched: dict[int, int] = {}
+    untargeted: int = -1
+
+    def add(element: Object) -> None:
+        Scheduler.version += 1
+        if element.start_time > Clock.time:
+            heapq.heappush(Scheduler.pending, (element.start_time, next(Scheduler.counter), element))
+            Scheduler.pending_ids.add(id(element))
+        else: Scheduler.activate(element)
+
+    def activate(element: Object) -> None:
+        Scheduler.version += 1
+        Scheduler.active[id(element)] = element
+        if Scheduler.queue is not None: Scheduler.queue.append(element)
+
+    def retire(element: Object) -> None:
+        del Scheduler.active[id(element)]
+        Scheduler.retired += 1
+        Scheduler.version += 1
+
+        targets = element.targets()
+        if targets is None: Scheduler.untargeted = Scheduler.version
+        else:
+            for target in targets: Scheduler.touched[id(target)] = Scheduler.version
+
+    def update() -> None:
+        while Scheduler.pending and Scheduler.pending[0][0] <= Clock.time:
+            element = heapq.heappop(Scheduler.pending)[2]
+            Scheduler.pending_ids.discard(id(element))
+            Scheduler.activate(element)
+
+        Scheduler.queue = list(Scheduler.active.values())
+        for element in Scheduler.queue:
+            element.update_time()
+            if element.update(): Scheduler.retire(element)
+        Scheduler.queue = None
+
+    def next_time() -> float|None:
+        times = [Scheduler.pending[0][0]] if Scheduler.pending else []
+        for element in Scheduler.active.values():
+            if not hasattr(element, 'transition_time'): continue
+            time = max(element.start_time, element.birth) + element.transition_time
+            if time > Clock.time: times.append(time)
+
+        return min(times, default=None)
+
+    def is_scheduled(element: any) -> bool:
+        if isinstance(element, Batched): return Batch.is_running(element.lanes)
+        return id(element) in Scheduler.active or id(element) in Scheduler.pending_ids
+
+    def get_targets() -> set[int]|None:
+        version, targets = Scheduler.targets
+        if version == Scheduler.version: return targets
+
+        targets = set()
+        for element in Scheduler.active.values():
+            element_targets = element.targets()
+            if element_targets is None:
+                targets = None
+                break
+            targets.update(map(id, element_targets))
+
+        Scheduler.targets = (Scheduler.version, targets)
+        return targets
+
+    def touched_since(version: int, keys: set[int]) -> bool:
+        if Scheduler.untargeted > version: return True
+        return any(Scheduler.touched.get(key, -1) > version for key in keys)
+
+    def stats() -> dict[str, int]:
+        return {'pending': len(Scheduler.pending), 'active': len(Scheduler.active), 'retired': Scheduler.retired}
+
+    def clear() -> None:
+        Scheduler.pending.clear()
+        Scheduler.pending_ids.clear()
+        Scheduler.active.clear()
+        Scheduler.retired = 0
+        Scheduler.targets = (None, set())
+        Scheduler.touched.clear()
+        Scheduler.untargeted = -1
+        Scheduler.version += 1
 
 
 class Object:
-    elements: list = []
-
     def __init__(self, start_time: float=0):
         self.time = 0
         self.start_time = start_time
+        self.birth = Clock.birth_time()
         Object.add(self)
 
     def update_time(self) -> None:
         if Clock.time < self.start_time: return
-        self.time += Clock.get_fps()
+        self.time = Clock.time - max(self.start_time, self.birth)
+
+    def targets(self) -> tuple[any]:
+        return ()
 
     def add(element: any) -> None:
-        Object.elements.append(element)
+        Scheduler.add(element)
     
     def update_all() -> None:
-        for element in Object.elements:
-            element.update_time()
-            if element.update():
-                Object.elements.remove(element)
+        Batch.update()
+        Scheduler.update()
+        Clock.updated = Clock.frame
+
+    def next_frame() -> int|None:
+        time = Scheduler.next_time()
+        if time is None: return None
+        return max(Clock.frame_at(time), Clock.frame + 1)
+
+    def seek(time: float) -> None:
+        frame = round(time * Clock.fps)
+        if frame < Clock.frame:
+            raise ValueError(f'cannot seek back to {time}s, the scene is already at {Clock.time}s')
+
+        while (next_frame := Object.next_frame()) is not None and next_frame < frame:
+            for event_frame in (next_frame - 1, next_frame):
+                if event_frame <= Clock.frame: continue
+                Clock.set_frame(event_frame)
+                Object.update_all()
+
+        if frame - 1 > Clock.frame:
+            Clock.set_frame(frame - 1)
+            Object.update_all()
+
+        Clock.set_frame(frame)
+        Object.update_all()
 
 
 class Event(Object):
@@ -32,7 +155,9 @@ class Event(Object):
         self.value = get_value(value)
         self.transition_time = transition_time
         self.update_element = update_element
-        Object.add(self)
+
+    def targets(self) -> tuple[any]:
+        return (self.element,)
 
     def update(self) -> bool:
         if Clock.time < self.start_time: return False
@@ -45,7 +170,7 @@ class Event(Object):
     
 
 class LerpEvent(Object):
-    def __init__(self, element: any, attribute: str, start: any, end: any, transition_time: float, start_time: float=0, update_element: bool=False, update_function: callable|None=None):
+    def __init__(self, element: any, attribute: str, start: any, end: any, transition_time: float, start_time: float=0, update_element: bool=False, update_function: callable|None=None, easing: easing=None):
         super().__init__(start_time)
         self.element = element
         self.attribute = attribute
@@ -57,7 +182,10 @@ class LerpEvent(Object):
         self.transition_time = transition_time
         self.update_element = update_element
         self.update_function = update_function
-        Object.add(self)
+        self.easing = get_easing(easing)
+
+    def targets(self) -> tuple[any]:
+        return (self.element,)
 
     def update(self) -> bool:
         if Clock.time < self.start_time: return False
@@ -69,6 +197,7 @@ class LerpEvent(Object):
             return True
 
         t = self.time / self.transition_time
+        if self.easing: t = self.easing(t)
 
         value = self.start + (self.end - self.start) * t
         # print(value)
@@ -84,7 +213,7 @@ class LerpEvent(Object):
 
 
 class LerpEventGroup(Object):
-    def __init__(self, elements: tuple[any], attributes: tuple[str], starts: tuple[any], ends: tuple[any], transition_time: float, start_time: float=0, update_elements: bool=False, update_function: callable|None=None):
+    def __init__(self, elements: tuple[any], attributes: tuple[str], starts: tuple[any], ends: tuple[any], transition_time: float, start_time: float=0, update_elements: bool=False, update_function: callable|None=None, easing: easing=None):
         super().__init__(start_time)
         self.elements = elements
         self.attributes = attributes
@@ -93,29 +222,39 @@ class LerpEventGroup(Object):
         self.transition_time = transition_time
         self.update_elements = update_elements
         self.update_function = update_function
-        Object.add(self)
+        self.easing = get_easing(easing)
+
+    def targets(self) -> tuple[any]:
+        return self.elements
+
+    def interpolate(self, t: float) -> list[any]:
+        starts, ends = [start.get() for start in self.starts], [end.get() for end in self.ends]
+        if not is_number(*starts, *ends):
+            return [start + (end - start) * t for start, end in zip(starts, ends)]
+
+        starts = np.array(starts, dtype=float)
+        return (starts + (np.array(ends, dtype=float) - starts) * t).tolist()
+
+    def update_all_elements(self) -> None:
+        if not self.update_elements: return
+        if self.update_function: return self.update_function()
+        for element in self.elements: element.update()
 
     def update(self) -> bool:
         if Clock.time < self.start_time: return False
         if self.time >= self.transition_time:
             for element, attribute, end in zip(self.elements, self.attributes, self.ends):
                 setattr(element, attribute, end.get())
-                if self.update_elements:
-                    if self.update_function: self.update_function()
-                    else: element.update()
-
+            self.update_all_elements()
             return True
 
         t = self.time / self.transition_time
-        for element, attribute, start, end in zip(self.elements, self.attributes, self.starts, self.ends):
-            value = start + (end - start) * t
+        values = self.interpolate(self.easing(t) if self.easing else t)
+        for element, attribute, value in zip(self.elements, self.attributes, values):
             if not (hasattr(value, 'r') and hasattr(value, 'g') and hasattr(value, 'b')): value = Value(value)
-
             setattr(element, attribute, value)
-            if self.update_elements:
-                if self.update_function: self.update_function()
-                else: element.update()
 
+        self.update_all_elements()
         return False
 
 
@@ -126,6 +265,9 @@ class Action(Object):
         self.action = action
         self.args = args
         self.kwargs = kwargs
+
+    def targets(self) -> tuple[any]|None:
+        return get_owner(self.action)
     
     def update(self) -> bool:
         if Clock.time < self.start_time: return False
@@ -141,6 +283,9 @@ class ActionEvent(Object):
         self.args = args
         self.kwargs = kwargs
         self.transition_time = transition_time
+
+    def targets(self) -> tuple[any]|None:
+        return get_owner(self.action)
     
     def update(self) -> bool:
         if Clock.time < self.start_time: return False
@@ -148,17 +293,45 @@ class ActionEvent(Object):
         return self.time >= self.transition_time
 
 
+def get_owner(action: callable) -> tuple[any]|None:
+    owner = getattr(action, '__self__', None)
+    if owner is None: return None
+    return (owner,)
+
+
+constants: dict[tuple[type, float], Value] = {}
+max_constants = 4096
+
+
+def get_constant(value: int|float) -> Value:
+    key = (type(value), value)
+    constant = constants.get(key)
+    if constant is None:
+        if len(constants) >= max_constants: constants.clear()
+        constant = constants[key] = Value(value)
+    return constant
+
+
 def get_value(value: any) -> Value:
-    if isinstance(value, (Value, LerpValue, ContinuosValue)): return value
+    if isinstance(value, Value): return value
+    if type(value) in (int, float): return get_constant(value)
     if hasattr(value, 'r') and hasattr(value, 'g') and hasattr(value, 'b'): return value
     return Value(value)
 
 
+def get_mutable(value: any) -> Value:
+    if type(value) in (int, float): return MutableValue(value)
+    return get_value(value)
+
+
 def get_values(values: list[any]) -> list[Value]:
     return [get_value(value) for value in values]
 
 
 class Value:
+    __slots__ = ('value',)
+    static = True
+
     def __init__(self, value: any):
         self.value = value
     
@@ -218,14 +391,84 @@ class Value:
         return f'Value({self.value})'
 
 
+class MutableValue(Value):
+    __slots__ = ()
+    static = False
+
+
+def get_dependencies(values: any) -> list[any]:
+    if not isinstance(values, (list, tuple)): return [values]
+    return [value for item in values for value in get_dependencies(item)]
+
+
+class Reactive:
+    dependencies: tuple[str, ...] = ()
+    should_update = True
+    dirty = True
+    spatial = None
+
+    def __setattr__(self, name: str, value: any) -> None:
+        object.__setattr__(self, name, value)
+        if name in self.dependencies: object.__setattr__(self, 'dirty', True)
+
+    def track(self) -> None:
+        values = get_dependencies([getattr(self, name, None) for name in self.dependencies])
+        self.dynamic = [value for value in values if not getattr(value, 'static', True)]
+        self.should_update = len(self.dynamic) > 0
+        self.snapshot = None
+        self.dirty = False
+
+    def changed(self) -> bool:
+        dirty = self.dirty
+        if dirty: self.track()
+        if self.dynamic:
+            snapshot = [value.get() for value in self.dynamic]
+            if snapshot == self.snapshot and not dirty: return False
+            self.snapshot = snapshot
+        elif not dirty: return False
+
+        self.touch()
+        return True
+
+    def touch(self) -> None:
+        if self.spatial is not None: self.spatial.touched.add(self)
+
+
+def is_number(*values: any) -> bool:
+    return all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in values)
+
+
+class Batched:
+    lanes = None
+
+    def get_lane(self, name: str) -> float:
+        return float(getattr(Batch, name)[self.lanes[0]])
+
+    def set_lane(self, name: str, value: float) -> None:
+        getattr(Batch, name)[self.lanes[0]] = value
+
+    value = property(lambda self: self.get_lane('value'), lambda self, value: self.set_lane('value', value))
+    start = property(lambda self: self.get_lane('start'), lambda self, value: self.set_lane('start', value))
+    end = property(lambda self: self.get_lane('end'), lambda self, value: self.set_lane('end', value))
+    t = property(lambda self: self.get_lane('t'))
+
+
 class LerpValue(Object, Value):
-    def __init__(self, start: float, end: float, transition_time: float, start_time: float=0, function: callable=None):
+    static = False
+
+    def __new__(cls, start: float, end: float, transition_time: float, start_time: float=0, function: callable=None, easing: easing=None):
+        if cls is LerpValue and Batch.enabled and function is None and has_table(easing) and is_number(start, end):
+            return object.__new__(BatchedLerpValue)
+        return object.__new__(cls)
+
+    def __init__(self, start: float, end: float, transition_time: float, start_time: float=0, function: callable=None, easing: easing=None):
         Object.__init__(self, start_time)
         Value.__init__(self, start)
 
         self.t = 0
         self.end = end
         self.function = function
+        self.easing = get_easing(easing)
         self.value = self.start = start
         if function is not None: self.value = function(self.value)
         self.transition_time = transition_time
@@ -234,16 +477,31 @@ class LerpValue(Object, Value):
         if Clock.time < self.start_time: return False
 
         self.t = min(self.time/self.transition_time, 1)
-        self.value = self.start + (self.end - self.start) * self.t
+        t = self.easing(self.t) if self.easing else self.t
+        self.value = self.start + (self.end - self.start) * t
         if self.function: self.value = self.function(self.value)
 
         return self.t == 1
     
     def __neg__(self) -> LerpValue:
-        return LerpValue(-self.start, -self.end, self.transition_time)
+        return LerpValue(-self.start, -self.end, self.transition_time, easing=self.easing)
+
+
+class BatchedLerpValue(Batched, LerpValue):
+    def __init__(self, start: float, end: float, transition_time: float, start_time: float=0, function: callable=None, easing: easing=None):
+        self.start_time = start_time
+        self.transition_time = transition_time
+        self.function = None
+        self.easing = get_easing(easing)
+        self.lanes = Batch.allocate(self, (start,), (end,), start_time, transition_time, easing=get_index(self.easing))
+
+    def update(self) -> bool:
+        return not Batch.is_running(self.lanes)
 
 
 class SequenceValue(Object, Value):
+    static = False
+
     def __init__(
         self, values: list[any],
         transition_time: float, start_time: float=0,
@@ -257,23 +515,27 @@ class SequenceValue(Object, Value):
         self.function = function
         self.transition_time = transition_time
         self.lerp_transition_time = transition_time / (len(self.values) - 1)
-        self.current_lerp = None
-
-    def get_next_lerp(self) -> LerpValue|None:
-        if len(self.values) == 1: return None
-        start = self.values.pop(0)
-        return LerpValue(start, self.values[0], self.lerp_transition_time)
 
     def update(self) -> bool:
-        if self.current_lerp is None or self.current_lerp.t == 1:
-            self.current_lerp = self.get_next_lerp()
-            if self.current_lerp is None: return True
-        self.value = self.current_lerp.get()
+        if Clock.time < self.start_time: return False
 
-        return False
+        index = min(int(self.time / self.lerp_transition_time), len(self.values) - 2)
+        t = min(self.time / self.lerp_transition_time - index, 1)
+        start, end = self.values[index], self.values[index + 1]
+        self.value = start + (end - start) * t
+        if self.function: self.value = self.function(self.value)
+
+        return self.time >= self.transition_time
 
 
 class ContinuosValue(Object, Value):
+    static = False
+
+    def __new__(cls, start: float, step: float, transition_time: float, start_time: float=0, function: callable=None):
+        if cls is ContinuosValue and Batch.enabled and function is None and is_number(start, step):
+            return object.__new__(BatchedContinuosValue)
+        return object.__new__(cls)
+
     def __init__(self, start: float, step: float, transition_time: float, start_time: float=0, function: callable=None):
         Object.__init__(self, start_time)
         Value.__init__(self, start)
@@ -292,4 +554,17 @@ class ContinuosValue(Object, Value):
         return False
 
     def __neg__(self) -> LerpValue:
-        return ContinuosValue(-self.start, -self.step, self.transition_time)
\ No newline at end of file
+        return ContinuosValue(-self.start, -self.step, self.transition_time)
+
+
+class BatchedContinuosValue(Batched, ContinuosValue):
+    def __init__(self, start: float, step: float, transition_time: float, start_time: float=0, function: callable=None):
+        self.start_time = start_time
+        self.transition_time = transition_time
+        self.function = None
+        self.lanes = Batch.allocate(self, (start,), (start + step,), start_time, transition_time, continuous=True)
+
+    step = property(lambda self: self.end - self.start)
+
+    def update(self) -> bool:
+        return False
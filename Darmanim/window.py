@@ -1,22 +1,140 @@
 from __future__ import annotations
 import os
+import sys
+import queue
 import pygame
+import threading
 import subprocess
+from Darmanim import render
 from Darmanim.time import Clock
+from Darmanim.render import Render
 from Darmanim.color import get_color
-from Darmanim.values import Object, Action, get_value, LerpEventGroup
+from Darmanim.batch import Batch
+from Darmanim.profiler import Profiler
+from Darmanim.spatial import SpatialIndex
+from Darmanim.values import Object, Action, Scheduler, Batched, get_value, LerpEventGroup
+
+
+def union_rects(rects: list[pygame.Rect|None]) -> pygame.Rect|None:
+    rects = [rect for rect in rects if rect is not None]
+    if not rects: return None
+    return rects[0].unionall(rects[1:])
+
+
+def get_items(element: any, surface: Surface) -> list[any]:
+    items = [element]
+    for value in vars(element).values():
+        for item in (value if isinstance(value, (list, tuple)) else (value,)):
+            items.append(item)
+            if hasattr(item, '__dict__') and item is not surface: items.extend(vars(item).values())
+    return items
+
+
+def classify(element: any, surface: Surface, targets: set[int]) -> tuple[bool, list[Batched], set[int]]:
+    items = get_items(element, surface)
+    batched = [item for item in items if isinstance(item, Batched)]
+    scheduled = any(id(item) in targets or Scheduler.is_scheduled(item) for item in items if not isinstance(item, Batched))
+    return scheduled, batched, {id(item) for item in items}
+
+
+def is_animated(element: any, surface: Surface, batched: list[Batched]=()) -> bool:
+    if getattr(element, 'surface', None) is not surface: return True
+    if hasattr(element, 'is_animated') and element.is_animated(): return True
+    if getattr(element, 'should_update', False): return True
+    if Clock.time < getattr(element, 'start_time', 0): return True
+    return any(Batch.is_running(item.lanes) for item in batched)
+
+
+def get_pixel_format(surface: pygame.Surface) -> str|None:
+    if surface.get_bytesize() != 4 or sys.byteorder != 'little': return None
+    return {(0xff0000, 0xff00, 0xff): 'bgr0', (0xff, 0xff00, 0xff0000): 'rgb0'}.get(surface.get_masks()[:3])
 
 
 class VideoMP4:
-    def __init__(self, output: str, surface: pygame.Surface):
+    def __init__(
+        self, output: str, surface: pygame.Surface, stream: bool=True,
+        threaded: bool=True, buffers: int=8, drop_frames: bool=False
+    ):
         self.output = output
         self.surface = surface
+        self.stream = stream
         self.width, self.height = self.surface.get_size()
         self.frame_count = 0
+        self.dropped = 0
+        self.drop_frames = drop_frames
+        self.pixel_format = get_pixel_format(surface)
         self.folder = os.path.join(os.path.dirname(__file__), 'frames')
+        self.process = None
+        self.thread = None
+        self.error = None
+
+        if self.stream: self.open_pipe()
+        if threaded: self.start_thread(buffers)
+
+    def open_pipe(self) -> None:
+        command = [
+            'ffmpeg', '-y',
+            '-f', 'rawvideo',
+            '-pix_fmt', self.pixel_format or 'rgb24',
+            '-s', f'{self.width}x{self.height}',
+            '-r', str(Clock.fps),
+            '-i', '-',
+            '-pix_fmt', 'yuv420p',
+            '-vcodec', 'libx264',
+            '-crf', '25',
+            self.output
+        ]
+
+        self.process = subprocess.Popen(command, stdin=subprocess.PIPE)
+
+    def start_thread(self, buffers: int) -> None:
+        self.free = queue.Queue()
+        self.frames = queue.Queue()
+        for _ in range(buffers): self.free.put(self.surface.copy())
+
+        self.thread = threading.Thread(target=self.encode_frames, name='VideoMP4', daemon=True)
+        self.thread.start()
+
+    def encode(self, surface: pygame.Surface, index: int) -> None:
+        if not self.stream: pygame.image.save(surface, f'{self.folder}/screen_{index:05d}.png')
+        elif self.pixel_format: self.process.stdin.write(surface.get_view('0'))
+        else: self.process.stdin.write(pygame.image.tobytes(surface, 'RGB'))
+
+    def encode_frames(self) -> None:
+        while (frame := self.frames.get()) is not None:
+            surface, index = frame
+            if self.error is None:
+                try: self.encode(surface, index)
+                except Exception as error: self.error = error
+            self.free.put(surface)
+
+    def check(self) -> None:
+        if self.error is not None: raise self.error
+
+    def get_buffer(self) -> pygame.Surface|None:
+        if self.drop_frames:
+            try: return self.free.get_nowait()
+            except queue.Empty: return None
+
+        while True:
+            self.check()
+            try: return self.free.get(timeout=0.1)
+            except queue.Empty: continue
 
     def write(self) -> None:
-        pygame.image.save(self.surface, f'{self.folder}/screen_{self.frame_count:05d}.png')
+        if self.thread is None:
+            self.encode(self.surface, self.frame_count)
+            self.frame_count += 1
+            return
+
+        self.check()
+        buffer = self.get_buffer()
+        if buffer is None:
+            self.dropped += 1
+            return
+
+        buffer.blit(self.surface, (0, 0))
+        self.frames.put((buffer, self.frame_count))
         self.frame_count += 1
     
     def clean_folder(self) -> None:
@@ -24,6 +142,20 @@ class VideoMP4:
             os.remove(f'{self.folder}/{file}')
 
     def release(self) -> None:
+        if self.thread is not None:
+            self.frames.put(None)
+            self.thread.join()
+            self.thread = None
+
+        if self.stream:
+            try: self.process.stdin.close()
+            except BrokenPipeError: pass
+            if self.process.wait() != 0:
+                raise subprocess.CalledProcessError(self.process.returncode, self.process.args)
+            return self.check()
+
+        self.check()
+
         command = [
             'ffmpeg',
             '-r', str(Clock.fps),
@@ -46,13 +178,14 @@ class Surface:
         x: int, y: int,
         size: tuple[int, int]=(0, 0), flags: int=0,
         color: any='background', border: any='white', border_width: int=0,
-        anchor_x: str='left', anchor_y: str='top', z_index: int=9999
+        anchor_x: str='left', anchor_y: str='top', z_index: int=9999,
+        retained: bool=False, culling: bool=True
     ):
-        self.screen = pygame.Surface(size, flags)
+        self.screen = pygame.Surface(Render.size(size), flags)
         self.color = get_color(color)
         self.border = get_color(border)
         self.border_width = get_value(border_width)
-        self.width, self.height = self.screen.get_size()
+        self.width, self.height = int(size[0]), int(size[1])
         self.center = (self.width/2, self.height/2)
 
         self.z_index = z_index
@@ -60,7 +193,16 @@ class Surface:
         self.elements = []
         self.hidden = []
 
-        self.rect = self.screen.get_rect(**{anchor_x: x, anchor_y: y})
+        self.retained = retained
+        self.layer = None
+        self.baked = None
+        self.baked_version = -1
+        self.classes = (None, [])
+
+        self.culling = culling
+        self.index = SpatialIndex()
+
+        self.rect = Render.get_rect(self.screen, **{anchor_x: x, anchor_y: y})
     
     def displace_to(self, x: int, y: int, start_time: float=0, transition_time: float=0) -> Surface:
         if start_time == 0:
@@ -79,6 +221,7 @@ class Surface:
         if start_time == 0:
             self.elements.remove(element)
             self.hidden.append((element, keep_updating))
+            self.index.clear()
             return self
         
         Action(self.hide, start_time, args=(element, 0))
@@ -89,6 +232,7 @@ class Surface:
             self.elements.append(element)
             for hidden, update in self.hidden:
                 if hidden == element: self.hidden.remove((element, update))
+            self.index.clear()
             return self
     
         Action(self.unhide, start_time, args=(element, 0))
@@ -97,6 +241,7 @@ class Surface:
     def remove(self, element: any, start_time: float) -> Surface:
         if start_time == 0:
             self.elements.remove(element)
+            self.index.clear()
             return self
         
         Action(self.remove, start_time, args=(element, 0))
@@ -108,6 +253,7 @@ class Surface:
             return element
 
         self.elements.append(element)
+        self.index.clear()
         if hasattr(element, 'attach'):
             try: element.attach(self, x, y)
             except TypeError: element.attach(self)
@@ -117,23 +263,79 @@ class Surface:
     def attach(self, window: Window) -> None:
         self.window = window
 
-    def show(self) -> None:
+    def bake(self, elements: list[any]) -> None:
+        if self.layer is None or self.layer.get_size() != self.screen.get_size():
+            self.layer = self.screen.copy()
+
+        screen, self.screen = self.screen, self.layer
         self.screen.fill(self.color.rgb())
-        for element in self.elements: element.show()
+        for i, element in enumerate(elements): Profiler.call(element, 'show', f'{type(element).__name__}#{i}')
+        self.screen = screen
+
+    def get_rect(self) -> tuple[int, int, int, int]:
+        return tuple(self.rect)
+
+    def cull(self) -> set[int]:
+        if not self.culling: return set()
+        return self.index.cull(self.elements, (0, 0, self.width, self.height))
+
+    def get_classes(self) -> list[tuple[bool, list[Batched], set[int]]]|None:
+        targets = Scheduler.get_targets()
+        if targets is None: return None
+
+        key = (Scheduler.version, tuple(map(id, self.elements)))
+        if self.classes[0] != key: self.classes = (key, [classify(element, self, targets) for element in self.elements])
+        return self.classes[1]
+
+    def draw_elements(self) -> list[pygame.Rect]|None:
+        culled = self.cull()
+        if not self.retained:
+            self.screen.fill(self.color.rgb())
+            for i, element in enumerate(self.elements):
+                if id(element) not in culled: Profiler.call(element, 'show', f'{type(element).__name__}#{i}')
+            return None
+
+        classes = self.get_classes() or []
+        static = 0
+        for element, (scheduled, batched, _) in zip(self.elements, classes):
+            if scheduled or is_animated(element, self, batched): break
+            static += 1
+
+        baked = tuple(map(id, self.elements[:static]))
+        redraw = baked != self.baked
+        if not redraw and self.baked_version != Scheduler.version:
+            redraw = Scheduler.touched_since(self.baked_version, set().union(*(keys for _, _, keys in classes[:static])))
+        self.baked_version = Scheduler.version
+        if redraw:
+            self.bake(self.elements[:static])
+            self.baked = baked
+
+        self.screen.blit(self.layer, (0, 0))
+        rects = [
+            Profiler.call(element, 'show', f'{type(element).__name__}#{i}')
+            for i, element in enumerate(self.elements[static:], static) if id(element) not in culled
+        ]
+        if redraw: return None
+        return [rect for rect in rects if rect is not None]
+
+    def show(self) -> pygame.Rect:
+        self.draw_elements()
         if self.border_width > 0:
-            pygame.draw.rect(self.screen, self.border.rgb(), (0, 0, self.width, self.height), width=self.border_width.get(int))
-        self.window.screen.blit(self.screen, self.rect)
+            render.rect(self.screen, self.border.rgb(), (0, 0, self.width, self.height), width=self.border_width.get(int))
+        return render.blit(self.window.screen, self.screen, self.rect)
     
     def add_element(self, element: any, z_index: int) -> None:
         element.z_index = z_index
         self.elements.append(element)
         self.elements = sorted(self.elements, key=lambda e: e.z_index, reverse=True)
+        self.index.clear()
     
     def update(self) -> None:
-        for element in self.elements:
+        for i, element in enumerate(self.elements):
             if hasattr(element, 'update'):
-                try: element.update(True)
-                except TypeError: element.update()
+                label = f'{type(element).__name__}#{i}'
+                try: Profiler.call(element, 'update', label, True)
+                except TypeError: Profiler.call(element, 'update', label)
         
         for element, update in self.hidden:
             if not update: continue
@@ -146,60 +348,178 @@ class Surface:
 
 
 class Window(Surface):
+    headless_size = (1920, 1080)
+    export: dict|None = None
+
     def __init__(
         self, size: tuple[int, int]=(0, 0), flags: int=0,
         title: str='Darmanim', icon: str='ratoncita.png',
         color: any='background',
-        output: str='', record_time: float=0, fps: int=60
+        output: str='', record_time: float=0, fps: int=60,
+        headless: bool=False, retained: bool=False, batched: bool=False,
+        scale: float=1, culling: bool=True
     ):
-        super().__init__(0, 0, size, flags, color)
+        if Window.export is not None:
+            headless = True
+            output = Window.export.get('output', output)
+            size = Window.export.get('size', size)
+            fps = Window.export.get('fps', fps)
+            scale = Window.export.get('scale', scale)
+            record_time = record_time or Window.export.get('duration', 0)
+
+        Render.set_scale(scale)
+        super().__init__(0, 0, size, flags, color, retained=retained, culling=culling)
         pygame.init()
         Clock.fps = fps
-        self.screen = pygame.display.set_mode(size, flags)
-        self.width, self.height = self.screen.get_size()
+        if batched: Batch.enable()
+        self.headless = headless
+
+        if headless:
+            if size == (0, 0): size = Window.headless_size
+        elif size == (0, 0) and scale != 1: size = pygame.display.get_desktop_sizes()[0]
+
+        output_size = size if scale > 1 else Render.size(size)
+        if headless: self.frame = pygame.Surface(output_size, flags)
+        else: self.frame = pygame.display.set_mode(output_size, flags)
+
+        self.screen = pygame.Surface(Render.size(size)) if scale > 1 else self.frame
+        self.width, self.height = self.screen.get_size() if scale == 1 else size
         self.center = (self.width/2, self.height/2)
 
         self.output = output
         self.record_time = record_time
         self.recording = False
+        self.dirty = self.drawn = None
 
         self.font = pygame.font.SysFont('Arial', 32)
 
+        if headless: return
         pygame.display.set_caption(title)
         pygame.display.set_icon(pygame.image.load(icon).convert_alpha())
 
-    def record(self) -> None:
+    def record(self, stream: bool=True, threaded: bool=True, buffers: int=8, drop_frames: bool=False) -> None:
+        if Window.export is not None and Window.export.get('probe'): return
         self.recording = True
-        self.video = VideoMP4(self.output, self.screen)
+        self.video = VideoMP4(self.output, self.frame, stream, threaded, buffers, drop_frames)
+
+    def profile(self, output: str='profile.json', overlay: bool=False) -> None:
+        Profiler.start(output, overlay)
 
     def show(self) -> None:
-        self.screen.fill(self.color.rgb())
-        for element in self.elements:
-            element.show()
+        Profiler.begin('show')
+        rects = self.draw_elements()
+        Profiler.end()
+
+        if self.frame is not self.screen:
+            Profiler.begin('downsample')
+            pygame.transform.smoothscale(self.screen, self.frame.get_size(), self.frame)
+            Profiler.end()
+            rects = None
+
+        if rects is None or self.drawn is None: self.dirty = None
+        else: self.dirty = self.drawn + rects
+        self.drawn = rects
 
     def update(self) -> None:
-        Clock.tick()
+        Profiler.begin('tick')
+        Clock.tick(throttle=not self.headless)
+        Profiler.end()
+
+        Profiler.begin('update_all')
         Object.update_all()
+        Profiler.end()
+
+        Profiler.begin('update')
+        super().update()
+        Profiler.end()
+
+    def seek(self, time: float) -> None:
+        Object.seek(time)
         super().update()
 
-    def run(self) -> None:
+    def preroll(self, frame: int) -> None:
+        Clock.set_frame(-Clock.fps)
+        while Clock.frame < frame - 1: self.update()
+
+    def screenshot(self, filename: str) -> None:
+        pygame.image.save(self.frame, filename)
+
+    def render_frame(self, time: float, filename: str) -> None:
+        self.seek(time)
+        self.show()
+        self.screenshot(filename)
+
+    def get_end_frame(self) -> int|None:
+        if self.record_time == 0: return None
+        return Clock.frame_at(self.record_time) + 2
+
+    def present(self) -> None:
+        rect = Profiler.draw_overlay(self.frame)
+        if rect is not None and self.dirty is not None: self.dirty.append(rect)
+        if rect is not None and self.drawn is not None: self.drawn.append(rect)
+
+        Profiler.begin('display.update')
+        if self.dirty is None: pygame.display.update()
+        else: pygame.display.update(self.dirty)
+        Profiler.end()
+
+    def show_progress(self) -> None:
+        if Window.export is not None: return
+
+        total = self.end_frame - Clock.frame_at(self.start_time)
+        if self.headless:
+            print(f'\r{self.video.frame_count}/{total}', end='', flush=True)
+        else:
+            text = self.font.render(f'{self.video.frame_count}/{total}', True, 'white')
+            rect = self.frame.blit(text, (10, 10))
+            if self.dirty is not None: self.dirty.append(rect)
+            if self.drawn is not None: self.drawn.append(rect)
+
+    def run(self, start_time: float=0) -> None:
+        if self.headless and self.record_time == 0:
+            if Window.export is not None: Window.export['untimed'] = True
+            raise ValueError('a headless window needs a record_time to know when to stop')
+
+        self.end_frame = self.get_end_frame()
+        if Window.export is not None:
+            if Window.export.get('probe'):
+                Window.export.update(output=self.output, fps=Clock.fps, end_frame=self.end_frame)
+                return pygame.quit()
+            start_time = Window.export.get('start_frame', 0) / Clock.fps
+            self.end_frame = Window.export.get('end_frame', self.end_frame)
+
+        if self.headless and not self.recording: self.record()
+
         self.running = True
+        self.start_time = start_time
         
-        Clock.time = -1
+        if start_time > 0 and Window.export is not None and not Window.export.get('seek'):
+            self.preroll(Clock.frame_at(start_time))
+        elif start_time > 0:
+            self.seek(start_time)
+            Clock.set_frame(Clock.frame - 1)
+        else: Clock.set_frame(-Clock.fps)
+
         while self.running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT: self.running = False
+            if not self.headless:
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT: self.running = False
             
+            Profiler.begin_frame()
             self.update()
             self.show()
 
             if self.recording and Clock.time >= 0:
+                Profiler.begin('video.write')
                 self.video.write()
-                self.running = not (self.record_time != 0 and Clock.time >= self.record_time + Clock.dt)
-                text = self.font.render(f'{self.video.frame_count}/{Clock.fps * self.record_time}', True, 'white')
-                self.screen.blit(text, (10, 10))
+                Profiler.end()
+                self.running = self.running and not (self.end_frame is not None and Clock.frame >= self.end_frame - 1)
+                self.show_progress()
         
-            pygame.display.update()
+            if not self.headless: self.present()
+            Profiler.end_frame()
 
+        if self.headless and Window.export is None: print()
+        if Profiler.enabled and Window.export is None: Profiler.save(Profiler.output)
         pygame.quit()
-        if self.recording: self.video.release()
\ No newline at end of file
+        if self.recording: self.video.release()
@@ -0,0 +1,112 @@
+from __future__ import annotations
+import sys
+import json
+import time
+import argparse
+import platform
+import subprocess
+import tracemalloc
+import multiprocessing
+
+try: import resource
+except ImportError: resource = None
+
+
+def get_peak_memory() -> float:
+    if resource is None: return tracemalloc.get_traced_memory()[1] / 2**20
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2**20 if sys.platform == 'darwin' else peak / 1024
+
+
+def run_scene(name: str, frames: int, size: tuple[int, int], fps: int, batched: bool=False) -> dict:
+    import pygame
+    from Darmanim.time import Clock
+    from Darmanim.window import Window
+    from Darmanim.profiler import Profiler
+    from benchmarks.scenes import scenes
+
+    if resource is None: tracemalloc.start()
+    window = Window(size=size, fps=fps, headless=True, batched=batched)
+    start = time.perf_counter()
+    scenes[name](window)
+    setup = time.perf_counter() - start
+
+    Profiler.start()
+    Clock.set_frame(-1)
+    start = time.perf_counter()
+    for _ in range(frames):
+        Profiler.begin_frame()
+        window.update()
+        window.show()
+        Profiler.end_frame()
+    elapsed = time.perf_counter() - start
+    pygame.quit()
+
+    report = Profiler.report()
+    return {
+        'frames': frames,
+        'setup_s': setup,
+        'fps': frames / elapsed,
+        'frame_ms': elapsed * 1000 / frames,
+        'peak_memory_mb': get_peak_memory(),
+        'phases': {phase: stats['per_frame_ms'] for phase, stats in report['phases'].items()},
+        'classes': {group: stats['per_frame_ms'] for group, stats in report['classes'].items()}
+    }
+
+
+def run(names: list[str], frames: int, size: tuple[int, int], fps: int, batched: bool=False) -> dict:
+    context = multiprocessing.get_context('spawn')
+    results = {}
+    for name in names:
+        with context.Pool(1) as pool:
+            results[name] = pool.apply(run_scene, (name, frames, size, fps, batched))
+        print_result(name, results[name])
+    return results
+
+
+def get_commit() -> str|None:
+    try: return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError): return None
+
+
+def print_result(name: str, result: dict, baseline: dict|None=None) -> None:
+    line = f'{name:<10} {result["fps"]:>9.1f} fps {result["frame_ms"]:>9.2f} ms/frame {result["peak_memory_mb"]:>8.1f} MB'
+    if baseline is not None: line += f'  {(result["frame_ms"] / baseline["frame_ms"] - 1) * 100:+.1f}% vs baseline'
+    print(line, flush=True)
+
+    phases = ', '.join(f'{phase} {ms:.2f}' for phase, ms in result['phases'].items())
+    print(f'{"":<10} {phases}', flush=True)
+
+
+def compare(results: dict, baseline: dict) -> None:
+    print(f'\ncompared with {baseline.get("commit") or "baseline"}:')
+    for name, result in results['scenes'].items():
+        if name in baseline['scenes']: print_result(name, result, baseline['scenes'][name])
+
+
+def main() -> None:
+    from benchmarks.scenes import scenes
+
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='Render the benchmark scenes headlessly and time them.')
+    parser.add_argument('scenes', nargs='*', help=f'scenes to run ({", ".join(scenes)}), defaults to all of them')
+    parser.add_argument('-f', '--frames', type=int, default=300, help='frames rendered per scene')
+    parser.add_argument('-s', '--size', type=int, nargs=2, default=(1280, 720), help='window size')
+    parser.add_argument('--fps', type=int, default=60, help='scene frame rate')
+    parser.add_argument('-b', '--batched', action='store_true', help='interpolate values with the batched backend')
+    parser.add_argument('-o', '--output', help='save the results as JSON')
+    parser.add_argument('-c', '--compare', help='JSON results of a previous run to compare with')
+    args = parser.parse_args()
+    for name in args.scenes:
+        if name not in scenes: parser.error(f'unknown scene {name!r}')
+
+    results = {
+        'commit': get_commit(), 'python': platform.python_version(),
+        'frames': args.frames, 'size': args.size, 'batched': args.batched,
+        'scenes': run(args.scenes or list(scenes), args.frames, tuple(args.size), args.fps, args.batched)
+    }
+
+    if args.compare:
+        with open(args.compare) as f: compare(results, json.load(f))
+
+    if args.output:
+        with open(args.output, 'w') as f: json.dump(results, f, indent=4)
@@ -0,0 +1,106 @@
+import numpy as np
+from Darmanim.time import Clock
+from Darmanim.window import Window
+from Darmanim.draw import Text, Circle, Line, Lines, AnimatedLines
+from Darmanim.color import LerpColor
+from Darmanim.draw.table import Table
+from Darmanim.plot import Plot
+from Darmanim.values import Action, LerpValue
+from Darmanim.graph import Graph, Grid, Function, Point, Path
+
+
+def text(window: Window) -> None:
+    lines = [f'{i:03d} the quick brown fox jumps over the lazy dog' for i in range(60)]
+    Text(window, lines, 10, 10, 14)
+
+
+def functions(window: Window) -> None:
+    graph = Graph(size=(window.width - 100, window.height - 100))
+    window.add(graph)
+
+    for i in range(40):
+        phase = i / 40 * 2 * np.pi
+        function = lambda x, phase=phase: np.sin(x * 2 + phase + Clock.time) * 4
+        graph.add(Function(function, resolution=0.001, call_update=True))
+
+
+def paths(window: Window) -> None:
+    graph = Graph(size=(window.width - 100, window.height - 100))
+    window.add(graph)
+
+    for i in range(20):
+        x = LerpValue(0, 60, 60, function=lambda t, i=i: 4 * np.sin(t * (i + 1) / 4))
+        y = LerpValue(0, 60, 60, function=lambda t, i=i: 4 * np.cos(t * (i + 2) / 4))
+        point = Point(x, y)
+        graph.add(point, Path(point, color='yellow'))
+
+
+def scatter(window: Window) -> None:
+    plot = Plot(size=(window.width - 100, window.height - 100))
+    window.add(plot)
+
+    rng = np.random.default_rng(0)
+    plot.scatter(rng.uniform(-5, 5, (5000, 2)).tolist(), radius=2)
+
+
+def table(window: Window) -> None:
+    columns, rows = 20, 40
+    grid = Table(window, 50, 50, window.width - 100, window.height - 100, columns, rows, size=12)
+    for row in range(rows):
+        for column in range(columns): grid.set_value(column, row, f'{row * columns + column}')
+
+
+def values(window: Window) -> None:
+    rng = np.random.default_rng(0)
+    for x, y, start_time in rng.uniform((0, 0, 0), (window.width, window.height, 4), (3000, 3)).tolist():
+        center = (LerpValue(x, window.width - x, 4, start_time), LerpValue(y, window.height - y, 4, start_time))
+        Circle(window, center, 2, LerpColor('red', 'blue', 4, start_time))
+
+
+def primitives(window: Window) -> None:
+    rng = np.random.default_rng(0)
+    for x, y in rng.uniform((0, 0), (window.width, window.height), (5000, 2)).tolist():
+        Circle(window, (x, y), 3)
+        Line(window, (x, y), (x + 5, y + 5))
+        Lines(window, [(x, y), (x + 3, y), (x + 3, y + 3)])
+
+
+def offscreen(window: Window) -> None:
+    rng = np.random.default_rng(0)
+    for x, y in rng.uniform((-4*window.width, -4*window.height), (5*window.width, 5*window.height), (10000, 2)).tolist():
+        Circle(window, (x, y), 3)
+
+    graph = Graph(size=(window.width - 100, window.height - 100))
+    window.add(graph)
+    for i in range(40): graph.add(Function(lambda x, i=i: np.sin(x + i) + 2*i - 10, resolution=0.001, call_update=False))
+
+
+def lines(window: Window) -> None:
+    for i in range(40): Line(window, (0, i * window.height / 40), (window.width, window.height - i * window.height / 40), line_type='dashed')
+    t = np.linspace(0, 40 * np.pi, 4000)
+    spiral = np.column_stack((window.width / 2 + t * np.cos(t), window.height / 2 + t * np.sin(t)))
+    AnimatedLines(window, spiral.tolist(), color='yellow', transition_time=0.25)
+
+    graph = Graph(size=(window.width - 100, window.height - 100), grid=Grid(-20, 20, -20, 20, x_interval=0.1, y_interval=0.1))
+    window.add(graph)
+    graph.reshape(window.width - 300, window.height - 200, transition_time=60)
+
+
+def actions(window: Window) -> None:
+    counter = [0]
+    def increment() -> None: counter[0] += 1
+    for i in range(50000): Action(increment, 0.001 + i * 0.0007)
+
+
+scenes: dict[str, callable] = {
+    'text': text,
+    'functions': functions,
+    'paths': paths,
+    'scatter': scatter,
+    'table': table,
+    'values': values,
+    'primitives': primitives,
+    'offscreen': offscreen,
+    'lines': lines,
+    'actions': actions
+}